@@ -36,6 +36,18 @@ except ImportError:
     PDF_AVAILABLE = False
     logging.warning("PyPDF2库未安装，PDF处理将使用降级模式")
 
+# 本地文件扩展名 -> 来源类型
+_EXTENSION_SOURCE_TYPES = {
+    '.pdf': 'pdf',
+    '.doc': 'doc',
+    '.docx': 'doc',
+    '.xls': 'excel',
+    '.xlsx': 'excel',
+    '.txt': 'txt',
+    '.md': 'markdown',
+    '.json': 'json'
+}
+
 # 生产级日志配置
 class JsonFormatter(logging.Formatter):
     """JSON格式日志"""
@@ -429,29 +441,20 @@ class KnowledgeCollector:
         """
         # 根据URL或文件扩展名判断类型
         parsed_url = urlparse(source_url)
+        lowered_url = source_url.lower()
         
         if parsed_url.scheme in ['http', 'https']:
             return 'web'
-        elif source_url.lower().endswith('.pdf'):
+        elif lowered_url.endswith('.pdf'):
             return 'pdf'
-        elif source_url.lower().endswith(('.doc', '.docx')):
+        elif lowered_url.endswith(('.doc', '.docx')):
             return 'doc'
-        elif source_url.lower().endswith(('.xls', '.xlsx')):
+        elif lowered_url.endswith(('.xls', '.xlsx')):
             return 'excel'
         elif parsed_url.scheme in ['file', ''] and os.path.exists(source_url):
             # 本地文件，根据扩展名判断
-            ext = Path(source_url).suffix.lower()
-            type_mapping = {
-                '.pdf': 'pdf',
-                '.doc': 'doc',
-                '.docx': 'doc',
-                '.xls': 'excel',
-                '.xlsx': 'excel',
-                '.txt': 'txt',
-                '.md': 'markdown',
-                '.json': 'json'
-            }
-            return type_mapping.get(ext, 'txt')
+            ext = os.path.splitext(lowered_url)[1]
+            return _EXTENSION_SOURCE_TYPES.get(ext, 'txt')
         else:
             # 默认使用配置中的类型
             return content_types[0] if content_types else 'web'
@@ -857,6 +860,7 @@ class KnowledgeCollector:
         """
         min_length = quality_requirements.get('min_content_length', 100)
         required_fields = quality_requirements.get('required_fields', [])
+        required_field_set = frozenset(required_fields)
         
         total_items = len(collected_content)
         if total_items == 0:
@@ -884,13 +888,9 @@ class KnowledgeCollector:
                 })
                 continue
                 
-            # 检查必需字段
-            missing_fields = []
-            for field in required_fields:
-                if field not in item:
-                    missing_fields.append(field)
-                    
-            if missing_fields:
+            # 检查必需字段：先整体做一次集合比较，有缺失时再按原顺序列出缺失字段
+            if not item.keys() >= required_field_set:
+                missing_fields = [field for field in required_fields if field not in item]
                 issues_found.append({
                     'source_id': item.get('source_id'),
                     'issue': f'缺少必需字段: {missing_fields}',
@@ -7,17 +7,16 @@
 
 import json
 import re
+import os
+import mmap
+import heapq
 import logging
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -284,12 +283,13 @@ class GenericTagExtractor:
         self.taxonomy_path = Path(taxonomy_path) if taxonomy_path else Path("config/tag_taxonomy.json")
         self.taxonomy = self._load_taxonomy()
         self.document_content = ""
+        self._doc_len = 0
         self.extraction_results: List[ExtractionResult] = []
         
         # 初始化组件
         self.business_evaluator = BusinessValueEvaluator()
         
-        logger.info(f"通用标签提取器初始化完成，加载 {self._get_total_tags()} 个标签")
+        logger.info("通用标签提取器初始化完成，加载 %d 个标签", self._get_total_tags())
     
     def _load_taxonomy(self) -> Dict[str, CategoryConfig]:
         """加载标签体系"""
@@ -327,7 +327,31 @@ class GenericTagExtractor:
     def set_document_content(self, content: str):
         """设置文档内容"""
         self.document_content = content
-        logger.info(f"文档内容已设置，长度: {len(content)} 字符")
+        self._doc_len = len(content)
+        logger.info("文档内容已设置，长度: %d 字符", self._doc_len)
+    
+    def set_document_from_path(self, path: str):
+        """
+        从文件设置文档内容
+        
+        通过内存映射读取文件并直接从映射区解码，避免 read() 产生的中间 bytes 副本，
+        适用于多 MB 的大文档。
+        
+        Args:
+            path: 文档文件路径（UTF-8 编码）
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"文档文件不存在: {path}")
+        
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                content = ""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, 'utf-8')
+        
+        self.set_document_content(content)
     
     def extract_tags(self, mode: str = "extraction", 
                      max_tags: int = 15,
@@ -346,22 +370,22 @@ class GenericTagExtractor:
         if not self.document_content:
             raise ValueError("文档内容未设置，请先调用 set_document_content()")
         
-        logger.info(f"开始提取标签，模式: {mode}, 最大数量: {max_tags}, 最小置信度: {min_confidence}")
+        logger.info("开始提取标签，模式: %s, 最大数量: %d, 最小置信度: %s",
+                    mode, max_tags, min_confidence)
         
         if mode == "extraction":
             results = self._extract_based_on_taxonomy(min_confidence)
         elif mode == "mining":
-            results = self._extract_based_on_content(min_confidence)
+            results = self._extract_based_on_content(min_confidence, max_tags)
         else:
             raise ValueError(f"不支持的模式: {mode}，请选择 'extraction' 或 'mining'")
         
-        # 按置信度排序并限制数量
-        results.sort(key=lambda x: x.confidence, reverse=True)
-        results = results[:max_tags]
+        # 按置信度取前 max_tags 个（部分选择，无需全量排序）
+        results = heapq.nlargest(max_tags, results, key=attrgetter('confidence'))
         
         self.extraction_results = results
         
-        logger.info(f"标签提取完成，共提取 {len(results)} 个标签")
+        logger.info("标签提取完成，共提取 %d 个标签", len(results))
         return results
     
     def _extract_based_on_taxonomy(self, min_confidence: float) -> List[ExtractionResult]:
@@ -392,43 +416,52 @@ class GenericTagExtractor:
         
         return results
     
-    def _extract_based_on_content(self, min_confidence: float) -> List[ExtractionResult]:
+    def _extract_based_on_content(self, min_confidence: float,
+                                  max_tags: Optional[int] = None) -> List[ExtractionResult]:
         """基于文档内容挖掘（简化版）"""
         # 实际应用中可使用NLP技术进行实体识别和关键词提取
         # 这里使用简单的关键词频率统计作为示例
         
-        results = []
+        content = self.document_content
         
         # 提取高频词作为候选标签
-        words = re.findall(r'[\u4e00-\u9fff]{2,8}', self.document_content)
+        words = re.findall(r'[\u4e00-\u9fff]{2,8}', content)
         word_freq = {}
         
         for word in words:
             if len(word) >= 2:
                 word_freq[word] = word_freq.get(word, 0) + 1
         
-        # 选择高频词作为候选
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        # 选择高频词作为候选（取前50个高频词）
+        top_words = heapq.nlargest(50, word_freq.items(), key=itemgetter(1))
         
-        for word, freq in sorted_words[:50]:  # 取前50个高频词
+        # 内层循环只收集轻量元组 (置信度, -序号, 词)，序号保证同分时保持原顺序
+        candidates = []
+        for order, (word, freq) in enumerate(top_words):
             confidence = min(0.5 + freq * 0.05, 0.95)
             
             if confidence >= min_confidence:
                 # 评估业务价值
-                value_eval = self.business_evaluator.evaluate(word, self.document_content)
+                value_eval = self.business_evaluator.evaluate(word, content)
                 
                 if value_eval["has_business_value"]:
-                    result = ExtractionResult(
-                        tag_name=word,
-                        category="内容挖掘",
-                        confidence=confidence,
-                        relevance=confidence * 0.85,
-                        source="content_mining",
-                        business_value="中"
-                    )
-                    results.append(result)
-        
-        return results
+                    candidates.append((confidence, -order, word))
+        
+        if max_tags is not None:
+            candidates = heapq.nlargest(max_tags, candidates)
+        
+        # 仅为最终保留的候选构建 ExtractionResult
+        return [
+            ExtractionResult(
+                tag_name=word,
+                category="内容挖掘",
+                confidence=confidence,
+                relevance=confidence * 0.85,
+                source="content_mining",
+                business_value="中"
+            )
+            for confidence, _, word in candidates
+        ]
     
     def _calculate_tag_confidence(self, tag: TagConfig, category: str) -> float:
         """计算标签置信度"""
@@ -436,9 +469,10 @@ class GenericTagExtractor:
         
         # 检查标签名称和别名在文档中的出现情况
         all_names = [tag.name] + tag.aliases
+        content = self.document_content
         
         for name in all_names:
-            count = self.document_content.count(name)
+            count = content.count(name)
             if count > 0:
                 # 出现次数越多，置信度越高
                 confidence_boost = min(count * 0.1, 0.3)
@@ -446,8 +480,9 @@ class GenericTagExtractor:
                 break
         
         # 检查是否在文档开头（标题区域）
+        head = content[:200]
         for name in all_names:
-            if name in self.document_content[:200]:
+            if name in head:
                 base_confidence += 0.1
                 break
         
@@ -507,33 +542,29 @@ class GenericTagExtractor:
     
     def _find_content_evidence(self, tag_name: str) -> str:
         """查找内容证据"""
-        if not self.document_content:
+        content = self.document_content
+        if not content:
             return ""
+        doc_len = self._doc_len
         
         # 直接匹配
-        if tag_name in self.document_content:
+        idx = content.find(tag_name)
+        if idx != -1:
             # 提取上下文
-            try:
-                idx = self.document_content.index(tag_name)
-                start = max(0, idx - 30)
-                end = min(len(self.document_content), idx + len(tag_name) + 30)
-                context = self.document_content[start:end]
-                return f"文档中提到: ...{context}..."
-            except ValueError:
-                pass
+            start = max(0, idx - 30)
+            end = min(doc_len, idx + len(tag_name) + 30)
+            context = content[start:end]
+            return f"文档中提到: ...{context}..."
         
         # 检查相关词
         related_terms = self._get_related_terms(tag_name)
         for term in related_terms:
-            if term in self.document_content:
-                try:
-                    idx = self.document_content.index(term)
-                    start = max(0, idx - 20)
-                    end = min(len(self.document_content), idx + len(term) + 20)
-                    context = self.document_content[start:end]
-                    return f"文档中提到相关概念: ...{context}..."
-                except ValueError:
-                    pass
+            idx = content.find(term)
+            if idx != -1:
+                start = max(0, idx - 20)
+                end = min(doc_len, idx + len(term) + 20)
+                context = content[start:end]
+                return f"文档中提到相关概念: ...{context}..."
         
         return ""
     
@@ -562,15 +593,21 @@ class GenericTagExtractor:
         
         return recommendations
     
-    def generate_report(self) -> Dict[str, Any]:
-        """生成标签提取报告"""
+    def generate_report(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        生成标签提取报告
+        
+        Args:
+            timestamp: 提取时间戳（ISO格式），为None时使用当前时间；
+                批量处理时可传入同一个缓存值，避免每个文档重复取时间
+        """
         if not self.extraction_results:
             return {"status": "error", "message": "未提取标签"}
         
         correctness_result = self.perform_correctness_check()
         
         # 计算覆盖率
-        coverage = len(self.extraction_results) / max(len(self.document_content) / 100, 1)
+        coverage = len(self.extraction_results) / max(self._doc_len / 100, 1)
         
         # 统计业务价值分布
         value_distribution = {}
@@ -605,8 +642,8 @@ class GenericTagExtractor:
                 "recommendations": correctness_result["recommendations"]
             },
             "metadata": {
-                "document_length": len(self.document_content),
-                "extraction_timestamp": datetime.now().isoformat(),
+                "document_length": self._doc_len,
+                "extraction_timestamp": timestamp or datetime.now().isoformat(),
                 "taxonomy_version": "2.0",
                 "total_taxonomy_tags": self._get_total_tags()
             }
@@ -616,6 +653,12 @@ class GenericTagExtractor:
 def main():
     """主函数 - 示例用法"""
     
+    # 配置日志（仅在作为脚本运行时配置，库导入时不修改全局日志设置）
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # 示例文档内容
     document_content = """
     新工居系统新办操作流程
@@ -687,7 +730,7 @@ def main():
         print(f"\n详细报告已保存到: {output_file}")
         
     except Exception as e:
-        logger.error(f"标签提取失败: {str(e)}")
+        logger.error("标签提取失败: %s", e)
         raise
 
 
@@ -8,23 +8,153 @@ FAQ自动补充和完整性检查循环
 import subprocess
 import sys
 import json
+import logging
 import re
 import os
+import mmap
 import argparse
-import sys
-import re
-import json
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 
 # 配置
 MAX_ITERATIONS = 5  # 最大循环次数，防止无限循环
 TARGET_SCORE = 0.7  # 目标分数
+STAGNATION_EPSILON = 1e-3  # 得分提升小于该值视为没有进展
+STAGNATION_LIMIT = 2  # 连续多少次没有进展后停止迭代
 CHECKER_SCRIPT = "faq_completeness_checklist.py"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+logger = logging.getLogger(__name__)
+
+# FAQ文件格式相关的正则（预编译，循环中重复使用）
+# 同时匹配FAQ序号标题和统计信息标题，一次扫描即可得到两者
+_STATS_HEADER = "## 📊 FAQ统计信息"
+_STATS_HEADER_BYTES = _STATS_HEADER.encode('utf-8')
+_FAQ_SCAN_RE = re.compile(r'### Q(\d+):|' + re.escape(_STATS_HEADER))
+_FAQ_SCAN_BYTES_RE = re.compile(_FAQ_SCAN_RE.pattern.encode('utf-8'))
 
-def run_completeness_check(faq_file: str, source_file: str, doc_type: str) -> Dict[str, Any]:
+# 检查脚本与本脚本位于同一目录，直接作为模块导入，避免每次迭代启动子进程
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+import faq_completeness_checklist as fcc
+
+# 各章节的补充FAQ模板（简化的FAQ生成逻辑，实际应用中可以使用LLM API）
+# 模块加载时构建一次，只读映射避免每次调用重新创建
+_FAQ_TEMPLATES = MappingProxyType({
+    "试用期管理": (
+        {
+            "question": "试用期的具体期限是如何规定的？",
+            "answer": "根据员工手册规定，试用期期限会在劳动合同中约定。员工录用后应立即到岗，2日内无正当理由未报到，公司有权解除劳动合同。试用期满前需填写转正资料，考核合格者予以转正。"
+        },
+        {
+            "question": "试用期考核包括哪些方面？",
+            "answer": "试用期考核包括道德品质、文化知识水平、业务能力、工作态度、工作表现、工作业绩等全面考核。不能按时完成工作任务、提供虚假资料、有违法违纪行为等情况将被视为不符合录用条件。"
+        },
+        {
+            "question": "试用期不符合录用条件的具体情形有哪些？",
+            "answer": "包括但不限于：1)不能完成工作任务或考核不合格；2)提供虚假学历证书、身份证等资料；3)与其他公司有未解决的法律纠纷；4)体检不符合要求；5)有违法违纪行为；6)未按时提交入职材料等。"
+        }
+    ),
+    "入职指引": (
+        {
+            "question": "新员工入职第一天需要完成哪些事项？",
+            "answer": "入职第一天需要：1)领取入职包；2)获取AD账号及邮箱；3)提交入职资料；4)签订劳动合同等入职材料；5)办理新工卡；6)加入集团平台通讯团队；7)部门熟悉介绍。最重要的是在当天下班前完成KOA新员工信息采集。"
+        },
+        {
+            "question": "如何加入和使用KOA系统？",
+            "answer": "KOA网页端登录地址：http://koa.kingsoft.cn，也可在应用商店下载客户端。使用AD账号和密码登录，主要功能包括饭卡充值、流程申请与审批、预定会议室、考勤说明、请假申请等。入职当天下班前必须完成新员工信息采集。"
+        },
+        {
+            "question": "金山协作系统如何使用？",
+            "answer": "访问官网https://xz.wps.cn下载客户端并安装。使用公司邮箱注册并登录激活，操作手册链接：https://kdocs.cn/l/ccRly20nLwHN。主要用于团队协作、文档共享、项目管理等。"
+        },
+        {
+            "question": "新员工信息采集流程是什么？",
+            "answer": "1)使用个人AD账户和密码登录KOA系统；2)进入首页-流程中心-人力资源-新员工信息采集；3)入职当天下班前填写并提交信息采集流程。务必认真核对信息，特别是工资卡号等关键信息。"
+        }
+    )
+})
+
+def run_completeness_check(faq_file: str, source_file: str, doc_type: str,
+                           use_subprocess: bool = False) -> Dict[str, Any]:
     """
-    运行完整性检查脚本，返回JSON格式的结果
+    运行完整性检查，返回结果字典
+    
+    默认在进程内直接调用检查模块；use_subprocess 为 True 时
+    以子进程方式运行检查脚本并从输出中解析JSON（兼容旧用法）
+    
+    Args:
+        faq_file: FAQ文件路径
+        source_file: 源文档路径
+        doc_type: 文档类型
+        use_subprocess: 是否以子进程方式运行检查脚本
+        
+    Returns:
+        检查结果字典
+    """
+    if use_subprocess:
+        return run_completeness_check_subprocess(faq_file, source_file, doc_type)
+    
+    try:
+        result = fcc.run_check(faq_file, source_file, doc_type)
+    except Exception as e:
+        logger.error("❌ 执行检查失败: %s", e)
+        return {"passed": False, "score": 0, "details": f"执行失败: {e}"}
+    
+    result["score"] = result["overall_score"]
+    logger.info("✅ 完成完整性检查，得分: %s", result['overall_score'])
+    return result
+
+class _JsonObjectScanner:
+    """
+    逐段扫描以 "{" 开头的文本，找到第一个花括号配平的JSON对象的结束位置
+    
+    层级、字符串和转义状态在多次 feed 之间保留，每段文本只扫描一次；
+    字符串内的花括号和转义字符不计入层级，因此其中出现 "}" 也不会影响结果
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_str = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> int:
+        """
+        扫描新的一段文本
+        
+        Returns:
+            对象在该段文本中的结束位置（不含），对象尚未完整时返回 -1
+        """
+        depth = self.depth
+        in_str = self.in_str
+        escaped = self.escaped
+        for pos, ch in enumerate(chunk):
+            if in_str:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_str = False
+            elif ch == '"':
+                in_str = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+        self.depth = depth
+        self.in_str = in_str
+        self.escaped = escaped
+        return -1
+
+def run_completeness_check_subprocess(faq_file: str, source_file: str, doc_type: str) -> Dict[str, Any]:
+    """
+    以子进程方式运行完整性检查脚本，返回JSON格式的结果
     
     Args:
         faq_file: FAQ文件路径
@@ -36,37 +166,59 @@ def run_completeness_check(faq_file: str, source_file: str, doc_type: str) -> Di
     """
     cmd = [
         sys.executable, CHECKER_SCRIPT,
-        faq_file, source_file,
+        os.path.abspath(faq_file), os.path.abspath(source_file),
         "--type", doc_type,
         "--debug"
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
-        
-        # 从stdout或stderr中提取JSON结果
-        output = result.stdout + result.stderr
-        json_start = output.find("📊 JSON结果:")
-        if json_start != -1:
-            json_start = output.find("{", json_start)
-            json_end = output.rfind("}") + 1
-            if json_start != -1 and json_end != -1:
-                json_str = output[json_start:json_end]
+        # 逐行读取合并后的stdout/stderr，读到完整的JSON结果后即停止，不缓存其余日志
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1, cwd=SCRIPT_DIR)
+        json_lines = []
+        scanner = _JsonObjectScanner()
+        capturing = False
+        with proc:
+            for line in proc.stdout:
+                if not capturing:
+                    if "📊 JSON结果:" in line:
+                        capturing = True
+                    continue
+                
+                if not json_lines:
+                    begin = line.find("{")
+                    if begin == -1:
+                        continue
+                    line = line[begin:]
+                end = scanner.feed(line)
+                if end == -1:
+                    json_lines.append(line)
+                    continue
+                json_lines.append(line[:end])
+                json_str = "".join(json_lines)
+                
                 try:
                     parsed = json.loads(json_str)
-                    print(f"✅ 成功解析检查结果，得分: {parsed.get('overall_score', 0)}")
+                    parsed.setdefault("score", parsed.get("overall_score", 0))
+                    logger.info("✅ 成功解析检查结果，得分: %s", parsed.get('overall_score', 0))
+                    proc.terminate()
                     return parsed
                 except json.JSONDecodeError as e:
-                    print(f"⚠️  JSON解析失败: {e}")
-                    print(f"JSON内容: {json_str[:200]}...")
+                    logger.warning("⚠️  JSON解析失败: %s", e)
+                    logger.warning("JSON内容: %s...", json_str[:200])
+                    break
+            
+            # 丢弃剩余输出并等待子进程结束
+            for _ in proc.stdout:
+                pass
         
         # 如果找到JSON但解析失败，返回基本结果
-        if result.returncode == 0:
+        if proc.returncode == 0:
             return {"passed": True, "score": 1.0, "details": "检查通过"}
         else:
-            return {"passed": False, "score": 0, "details": f"检查失败，返回码: {result.returncode}"}
+            return {"passed": False, "score": 0, "details": f"检查失败，返回码: {proc.returncode}"}
     except Exception as e:
-        print(f"❌ 执行检查失败: {e}")
+        logger.error("❌ 执行检查失败: %s", e)
         return {"passed": False, "score": 0, "details": f"执行失败: {e}"}
 
 def analyze_missing_content(check_result: Dict[str, Any]) -> List[str]:
@@ -78,7 +230,7 @@ def analyze_missing_content(check_result: Dict[str, Any]) -> List[str]:
     # 从JSON结果中获取未覆盖章节
     if "uncovered_sections" in check_result and check_result["uncovered_sections"]:
         missing_sections = check_result["uncovered_sections"]
-        print(f"📊 从检查结果中发现未覆盖章节: {', '.join(missing_sections)}")
+        logger.info("📊 从检查结果中发现未覆盖章节: %s", ', '.join(missing_sections))
         return missing_sections
     
     # 备用：从recommendations中提取
@@ -94,106 +246,314 @@ def analyze_missing_content(check_result: Dict[str, Any]) -> List[str]:
                     missing_sections.extend(sections)
     
     if missing_sections:
-        print(f"📊 从建议中发现需要补充的章节: {', '.join(missing_sections)}")
+        logger.info("📊 从建议中发现需要补充的章节: %s", ', '.join(missing_sections))
     else:
-        print("⚠️  未能从检查结果中识别缺失章节")
+        logger.warning("⚠️  未能从检查结果中识别缺失章节")
     
-    return list(set(missing_sections))  # 去重
+    return list(dict.fromkeys(missing_sections))  # 去重并保持顺序
 
 def generate_supplementary_faq(missing_sections: List[str], source_content: str) -> List[Dict[str, str]]:
     """
     根据缺失的章节，生成补充的FAQ
     """
-    supplementary_faq = []
-    
-    # 简化的FAQ生成逻辑，实际应用中可以使用LLM API
-    faq_templates = {
-        "试用期管理": [
-            {
-                "question": "试用期的具体期限是如何规定的？",
-                "answer": "根据员工手册规定，试用期期限会在劳动合同中约定。员工录用后应立即到岗，2日内无正当理由未报到，公司有权解除劳动合同。试用期满前需填写转正资料，考核合格者予以转正。"
-            },
-            {
-                "question": "试用期考核包括哪些方面？",
-                "answer": "试用期考核包括道德品质、文化知识水平、业务能力、工作态度、工作表现、工作业绩等全面考核。不能按时完成工作任务、提供虚假资料、有违法违纪行为等情况将被视为不符合录用条件。"
-            },
-            {
-                "question": "试用期不符合录用条件的具体情形有哪些？",
-                "answer": "包括但不限于：1)不能完成工作任务或考核不合格；2)提供虚假学历证书、身份证等资料；3)与其他公司有未解决的法律纠纷；4)体检不符合要求；5)有违法违纪行为；6)未按时提交入职材料等。"
-            }
-        ],
-        "入职指引": [
-            {
-                "question": "新员工入职第一天需要完成哪些事项？",
-                "answer": "入职第一天需要：1)领取入职包；2)获取AD账号及邮箱；3)提交入职资料；4)签订劳动合同等入职材料；5)办理新工卡；6)加入集团平台通讯团队；7)部门熟悉介绍。最重要的是在当天下班前完成KOA新员工信息采集。"
-            },
-            {
-                "question": "如何加入和使用KOA系统？",
-                "answer": "KOA网页端登录地址：http://koa.kingsoft.cn，也可在应用商店下载客户端。使用AD账号和密码登录，主要功能包括饭卡充值、流程申请与审批、预定会议室、考勤说明、请假申请等。入职当天下班前必须完成新员工信息采集。"
-            },
-            {
-                "question": "金山协作系统如何使用？",
-                "answer": "访问官网https://xz.wps.cn下载客户端并安装。使用公司邮箱注册并登录激活，操作手册链接：https://kdocs.cn/l/ccRly20nLwHN。主要用于团队协作、文档共享、项目管理等。"
-            },
-            {
-                "question": "新员工信息采集流程是什么？",
-                "answer": "1)使用个人AD账户和密码登录KOA系统；2)进入首页-流程中心-人力资源-新员工信息采集；3)入职当天下班前填写并提交信息采集流程。务必认真核对信息，特别是工资卡号等关键信息。"
-            }
-        ]
-    }
+    # 去重并保持章节顺序，一次性拼接所有章节的模板
+    ordered_sections = list(dict.fromkeys(missing_sections))
+    matched_sections = [section for section in ordered_sections if section in _FAQ_TEMPLATES]
+    supplementary_faq = list(chain.from_iterable(
+        _FAQ_TEMPLATES[section] for section in matched_sections
+    ))
     
-    for section in missing_sections:
-        if section in faq_templates:
-            supplementary_faq.extend(faq_templates[section])
-            print(f"✍️  为章节 '{section}' 生成 {len(faq_templates[section])} 个FAQ")
-        else:
-            print(f"⚠️  未找到章节 '{section}' 的FAQ模板")
+    if matched_sections:
+        logger.info("✍️  为章节 %s 生成 %d 个FAQ", ', '.join(matched_sections), len(supplementary_faq))
+    unmatched_sections = [section for section in ordered_sections if section not in _FAQ_TEMPLATES]
+    if unmatched_sections:
+        logger.warning("⚠️  未找到以下章节的FAQ模板: %s", ', '.join(unmatched_sections))
     
     if not supplementary_faq:
-        print("⚠️  未能生成任何补充FAQ")
+        logger.warning("⚠️  未能生成任何补充FAQ")
     
     return supplementary_faq
 
-def update_faq_file(new_faq: List[Dict[str, str]]) -> bool:
+def scan_faq_content(content) -> Tuple[int, int]:
+    """
+    单次扫描FAQ内容，返回最大的FAQ序号和统计信息标题的位置
+    
+    Args:
+        content: FAQ内容，可以是 str，也可以是 bytes/mmap（按UTF-8字节扫描）
+    
+    Returns:
+        (最大序号, 统计信息标题偏移)，没有FAQ时序号为0，没有统计信息标题时偏移为-1
+    """
+    pattern = _FAQ_SCAN_RE if isinstance(content, str) else _FAQ_SCAN_BYTES_RE
+    max_number = 0
+    stats_pos = -1
+    for match in pattern.finditer(content):
+        number = match.group(1)
+        if number is not None:
+            max_number = max(max_number, int(number))
+        elif stats_pos == -1:
+            stats_pos = match.start()
+    return max_number, stats_pos
+
+def read_next_faq_number(faq_file: str) -> int:
+    """读取FAQ文件，返回下一个可用的FAQ序号"""
+    with open(faq_file, 'rb') as f:
+        max_number, _ = scan_faq_content(f.read())
+    return max_number + 1
+
+def update_faq_file(faq_file: str, new_faq: List[Dict[str, str]],
+                    next_number: Optional[int] = None) -> Optional[int]:
     """
     将新生成的FAQ添加到FAQ文件中
+    
+    Args:
+        faq_file: FAQ文件路径
+        new_faq: 新生成的FAQ列表
+        next_number: 新FAQ的起始序号；为None时扫描文件中已有的最大序号
+        
+    Returns:
+        添加后下一个可用的FAQ序号，失败时返回None
     """
     try:
-        if not os.path.exists(FAQ_FILE):
-            print(f"错误：FAQ文件不存在: {FAQ_FILE}")
-            return False
+        if not os.path.exists(faq_file):
+            logger.error("错误：FAQ文件不存在: %s", faq_file)
+            return None
         
-        with open(FAQ_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(faq_file, 'r+b') as f:
+            # 通过内存映射找到统计信息的位置；已知起始序号时无需用正则扫描全部FAQ
+            stats_pos, tail = -1, b""
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if next_number is None:
+                        max_number, stats_pos = scan_faq_content(mm)
+                        next_number = max_number + 1
+                    else:
+                        stats_pos = mm.find(_STATS_HEADER_BYTES)
+                    if stats_pos != -1:
+                        tail = mm[stats_pos:]
+            if next_number is None:
+                next_number = 1
+            
+            # 生成新的FAQ内容
+            parts = ["\n\n"]
+            for i, faq in enumerate(new_faq):
+                parts.append(
+                    f"### Q{next_number + i}: {faq['question']}\n"
+                    f"**A:** {faq['answer']}\n\n"
+                    f"**来源**: 员工手册相关章节\n\n"
+                )
+            new_bytes = "".join(parts).encode('utf-8')
+            
+            # 添加到文件末尾（在统计信息之前）
+            if stats_pos != -1:
+                # 只重写统计信息及其之后的部分
+                f.seek(stats_pos)
+                f.write(new_bytes + b"\n")
+                f.write(tail)
+            else:
+                # 没有统计信息时直接追加，无需重写整个文件
+                f.seek(0, os.SEEK_END)
+                f.write(new_bytes)
         
-        # 找到最后一个FAQ的序号
-        faq_pattern = r'### Q(\d+):'
-        existing_numbers = [int(match) for match in re.findall(faq_pattern, content)]
-        next_number = max(existing_numbers) + 1 if existing_numbers else 1
+        logger.info("✅ 成功添加 %d 个新FAQ", len(new_faq))
+        return next_number + len(new_faq)
+    except Exception as e:
+        logger.error("❌ 更新FAQ文件失败: %s", e)
+        return None
+
+def process_one(faq_file: str, source_file: str, doc_type: str,
+                target_score: float = TARGET_SCORE,
+                max_iterations: int = MAX_ITERATIONS,
+                use_subprocess: bool = False,
+                pause_seconds: float = 0.0) -> Dict[str, Any]:
+    """
+    对单个 (FAQ文件, 源文档) 执行检查-补充循环，直到检查通过或达到最大迭代次数
+    
+    Args:
+        faq_file: FAQ文件路径
+        source_file: 源文档路径
+        doc_type: 文档类型
+        target_score: 目标分数
+        max_iterations: 最大迭代次数
+        use_subprocess: 是否以子进程方式运行检查脚本
+        pause_seconds: 每次迭代之间的等待秒数
+        
+    Returns:
+        处理结果字典：{"faq_file", "source_file", "passed", "score", "iterations", "message"}
+    """
+    outcome = {
+        "faq_file": faq_file,
+        "source_file": source_file,
+        "passed": False,
+        "score": 0,
+        "iterations": 0,
+        "message": ""
+    }
+    
+    # 检查文件是否存在
+    if not os.path.isfile(faq_file):
+        logger.error("❌ 错误：FAQ文件不存在: %s", faq_file)
+        outcome["message"] = "FAQ文件不存在"
+        return outcome
+    
+    if not os.path.isfile(source_file):
+        logger.error("❌ 错误：源文档不存在: %s", source_file)
+        outcome["message"] = "源文档不存在"
+        return outcome
+    
+    # 只在开始时读取一次FAQ文件得到下一个序号，之后随追加递增
+    try:
+        next_q_num = read_next_faq_number(faq_file)
+    except OSError as e:
+        logger.error("❌ 读取FAQ文件失败: %s", e)
+        outcome["message"] = "读取FAQ文件失败"
+        return outcome
+    
+    check_result = {}
+    best_score = -1.0
+    stagnant = 0
+    
+    for iteration in range(1, max_iterations + 1):
+        outcome["iterations"] = iteration
+        logger.info("")
+        logger.info("🔄 第 %d/%d 次迭代", iteration, max_iterations)
+        logger.info("-" * 70)
         
-        # 生成新的FAQ内容
-        new_content = "\n\n"
-        for i, faq in enumerate(new_faq):
-            q_num = next_number + i
-            new_content += f"### Q{q_num}: {faq['question']}\n"
-            new_content += f"**A:** {faq['answer']}\n\n"
-            new_content += f"**来源**: 员工手册相关章节\n\n"
+        # 运行完整性检查
+        logger.info("📋 运行完整性检查...")
+        check_result = run_completeness_check(faq_file, source_file, doc_type,
+                                              use_subprocess=use_subprocess)
+        outcome["score"] = check_result.get("score", 0)
         
-        # 添加到文件末尾（在统计信息之前）
-        stats_pattern = r"## 📊 FAQ统计信息"
-        if re.search(stats_pattern, content):
-            content = re.sub(stats_pattern, new_content + r"\n\1", content)
+        if check_result.get("passed", False):
+            logger.info("✅ 恭喜！FAQ完整性检查通过！")
+            logger.info("📊 最终得分: %.2f/%s", check_result.get('score', 0), target_score)
+            outcome["passed"] = True
+            outcome["message"] = "检查通过"
+            return outcome
+        
+        # 得分连续多次没有提升时提前停止，避免空转到最大迭代次数
+        current_score = check_result.get("score", 0)
+        if current_score <= best_score + STAGNATION_EPSILON:
+            stagnant += 1
         else:
-            content += new_content
+            best_score = current_score
+            stagnant = 0
+        if stagnant >= STAGNATION_LIMIT:
+            logger.warning("⚠️  得分停滞在 %.2f，已连续 %d 次迭代没有提升，共迭代 %d 次，停止迭代",
+                           best_score, stagnant, iteration)
+            outcome["message"] = f"得分停滞在 {best_score:.2f}"
+            return outcome
         
-        with open(FAQ_FILE, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # 分析缺失内容
+        logger.info("🔍 分析缺失内容...")
+        missing_sections = analyze_missing_content(check_result)
         
-        print(f"✅ 成功添加 {len(new_faq)} 个新FAQ")
-        return True
-    except Exception as e:
-        print(f"❌ 更新FAQ文件失败: {e}")
+        if not missing_sections:
+            logger.warning("⚠️  无法识别缺失内容，停止迭代")
+            outcome["message"] = "无法识别缺失内容"
+            return outcome
+        
+        logger.info("📌 发现缺失章节: %s", ', '.join(missing_sections))
+        
+        # 生成补充FAQ
+        logger.info("🤖 生成补充FAQ...")
+        # 这里简化处理，实际应该调用LLM API生成
+        supplementary_faq = generate_supplementary_faq(missing_sections, "")
+        
+        if not supplementary_faq:
+            logger.warning("⚠️  未能生成补充FAQ，停止迭代")
+            outcome["message"] = "未能生成补充FAQ"
+            return outcome
+        
+        logger.info("✍️  生成 %d 个补充FAQ", len(supplementary_faq))
+        
+        # 更新FAQ文件
+        logger.info("💾 更新FAQ文件...")
+        next_q_num = update_faq_file(faq_file, supplementary_faq, next_q_num)
+        if next_q_num is None:
+            outcome["message"] = "更新FAQ文件失败"
+            return outcome
+        
+        # 显示当前状态
+        logger.info("📊 当前得分: %.2f/%s", current_score, target_score)
+        logger.info("🎯 距离目标还差: %.2f", target_score - current_score)
+        
+        if pause_seconds > 0 and iteration < max_iterations:
+            logger.info("⏳ 等待%g秒后进入下一次迭代...", pause_seconds)
+            time.sleep(pause_seconds)
+    
+    # 达到最大迭代次数
+    logger.warning("=" * 70)
+    logger.warning("❌ 已达到最大迭代次数，FAQ完整性仍未达到目标")
+    logger.warning("最终得分: %.2f/%s", check_result.get('score', 0), target_score)
+    logger.warning("建议手动检查并补充缺失内容")
+    logger.warning("=" * 70)
+    outcome["message"] = "已达到最大迭代次数"
+    return outcome
+
+def load_manifest(manifest_path: str, default_type: str) -> List[Tuple[str, str, str]]:
+    """
+    读取批量处理清单
+    
+    每行一组：FAQ文件<TAB>源文档[<TAB>文档类型]（不含空格的路径也可用空白分隔），
+    空行和以 # 开头的行会被忽略
+    
+    Returns:
+        (FAQ文件, 源文档, 文档类型) 列表
+    """
+    jobs = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split('\t') if '\t' in line else line.split()
+            fields = [field.strip() for field in fields if field.strip()]
+            if len(fields) < 2:
+                raise ValueError(f"清单第 {line_no} 行格式错误: {line}")
+            doc_type = fields[2] if len(fields) > 2 else default_type
+            jobs.append((fields[0], fields[1], doc_type))
+    return jobs
+
+def run_manifest(args) -> bool:
+    """
+    使用进程池并行处理清单中的多个文档，返回是否全部通过
+    """
+    try:
+        jobs = load_manifest(args.manifest, args.type)
+    except (OSError, ValueError) as e:
+        logger.error("❌ 错误：无法读取清单文件: %s", e)
         return False
+    
+    if not jobs:
+        logger.warning("⚠️  清单中没有需要处理的文档: %s", args.manifest)
+        return False
+    
+    logger.info("📋 清单文件: %s（共 %d 个文档）", args.manifest, len(jobs))
+    
+    faq_files, source_files, doc_types = zip(*jobs)
+    n = len(jobs)
+    # 每个工作进程持有自己的检查模块和缓存，同一进程内处理的文档之间可复用解析结果
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count()) as executor:
+        outcomes = list(executor.map(
+            process_one, faq_files, source_files, doc_types,
+            [args.target_score] * n, [args.max_iterations] * n,
+            [args.subprocess] * n, [args.pause_seconds] * n
+        ))
+    
+    print("\n" + "=" * 70)
+    print(" " * 20 + "批量处理结果汇总")
+    print("=" * 70)
+    for outcome in outcomes:
+        status = "✅" if outcome["passed"] else "❌"
+        print(f"{status} {outcome['faq_file']}: 得分 {outcome['score']:.2f}，"
+              f"迭代 {outcome['iterations']} 次，{outcome['message']}")
+    passed_count = sum(1 for outcome in outcomes if outcome["passed"])
+    print(f"通过: {passed_count}/{n}")
+    print("=" * 70)
+    
+    return passed_count == n
 
 def main():
     """
@@ -215,6 +575,9 @@ def main():
   
   # 增加最大迭代次数
   python auto_faq_enrichment.py FAQ.md source.pdf --type employee_handbook --max-iterations 10
+  
+  # 按清单并行处理多个文档（每行: FAQ文件<TAB>源文档[<TAB>文档类型]）
+  python auto_faq_enrichment.py --manifest docs.txt --workers 4
         
 依赖说明:
   - 需要faq_completeness_checklist.py脚本
@@ -223,8 +586,8 @@ def main():
         """
     )
     
-    parser.add_argument('faq_file', help='FAQ文件路径（Markdown格式）')
-    parser.add_argument('source_file', help='源文档路径（PDF或文本格式）')
+    parser.add_argument('faq_file', nargs='?', help='FAQ文件路径（Markdown格式）')
+    parser.add_argument('source_file', nargs='?', help='源文档路径（PDF或文本格式）')
     parser.add_argument('--type', default='employee_handbook',
                        choices=['employee_handbook', 'policy_document', 'operation_guide', 'product_manual'],
                        help='文档类型（决定检查标准）')
@@ -233,90 +596,53 @@ def main():
     parser.add_argument('--max-iterations', type=int, default=MAX_ITERATIONS,
                        help=f'最大迭代次数（默认: {MAX_ITERATIONS}）')
     parser.add_argument('--verbose', '-v', action='store_true', help='显示详细日志')
+    parser.add_argument('--pause-seconds', type=float, default=0.0,
+                       help='每次迭代之间的等待秒数（默认: 0，不等待）')
+    parser.add_argument('--subprocess', action='store_true',
+                       help='以子进程方式运行检查脚本（兼容旧用法，默认在进程内调用）')
+    parser.add_argument('--manifest', help='批量处理清单文件，每行: FAQ文件<TAB>源文档[<TAB>文档类型]')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='批量处理时的并行进程数（默认: CPU核数）')
     
     args = parser.parse_args()
     
-    print("=" * 70)
-    print(" " * 15 + "FAQ自动补充和完整性检查循环")
-    print("=" * 70)
-    print(f"📄 FAQ文件: {args.faq_file}")
-    print(f"📚 源文档: {args.source_file}")
-    print(f"🏷️  文档类型: {args.type}")
-    print(f"🎯 目标分数: {args.target_score}")
-    print(f"🔄 最大迭代次数: {args.max_iterations}")
-    print("-" * 70)
+    if not args.manifest and not (args.faq_file and args.source_file):
+        parser.error("需要提供 faq_file 和 source_file，或使用 --manifest 指定批量清单")
     
-    # 检查文件是否存在
-    if not os.path.isfile(args.faq_file):
-        print(f"❌ 错误：FAQ文件不存在: {args.faq_file}")
-        sys.exit(1)
-    
-    if not os.path.isfile(args.source_file):
-        print(f"❌ 错误：源文档不存在: {args.source_file}")
-        sys.exit(1)
-    
-    # 检查检查脚本是否存在
-    checker_path = os.path.join(os.path.dirname(__file__), CHECKER_SCRIPT)
-    if not os.path.isfile(checker_path):
-        print(f"❌ 错误：检查脚本不存在: {checker_path}")
-        sys.exit(1)
-    
-    for iteration in range(1, args.max_iterations + 1):
-        print(f"\n🔄 第 {iteration}/{args.max_iterations} 次迭代")
-        print("-" * 70)
-        
-        # 运行完整性检查
-        print("📋 运行完整性检查...")
-        check_result = run_completeness_check(args.faq_file, args.source_file, args.type)
-        
-        if check_result.get("passed", False):
-            print(f"✅ 恭喜！FAQ完整性检查通过！")
-            print(f"📊 最终得分: {check_result.get('score', 0):.2f}/{TARGET_SCORE}")
-            sys.exit(0)
-        
-        # 分析缺失内容
-        print("🔍 分析缺失内容...")
-        missing_sections = analyze_missing_content(check_result)
-        
-        if not missing_sections:
-            print("⚠️  无法识别缺失内容，停止迭代")
-            sys.exit(1)
-        
-        print(f"📌 发现缺失章节: {', '.join(missing_sections)}")
-        
-        # 生成补充FAQ
-        print("🤖 生成补充FAQ...")
-        # 这里简化处理，实际应该调用LLM API生成
-        supplementary_faq = generate_supplementary_faq(missing_sections, "")
-        
-        if not supplementary_faq:
-            print("⚠️  未能生成补充FAQ，停止迭代")
-            sys.exit(1)
-        
-        print(f"✍️  生成 {len(supplementary_faq)} 个补充FAQ")
-        
-        # 更新FAQ文件
-        print("💾 更新FAQ文件...")
-        if not update_faq_file(supplementary_faq):
+    # 配置日志：默认只输出警告和错误，--verbose 时输出详细过程
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(message)s',
+        force=True
+    )
+    
+    logger.info("=" * 70)
+    logger.info(" " * 15 + "FAQ自动补充和完整性检查循环")
+    logger.info("=" * 70)
+    if not args.manifest:
+        logger.info("📄 FAQ文件: %s", args.faq_file)
+        logger.info("📚 源文档: %s", args.source_file)
+    logger.info("🏷️  文档类型: %s", args.type)
+    logger.info("🎯 目标分数: %s", args.target_score)
+    logger.info("🔄 最大迭代次数: %d", args.max_iterations)
+    logger.info("-" * 70)
+    
+    # 子进程模式下检查检查脚本是否存在
+    if args.subprocess:
+        checker_path = os.path.join(SCRIPT_DIR, CHECKER_SCRIPT)
+        if not os.path.isfile(checker_path):
+            logger.error("❌ 错误：检查脚本不存在: %s", checker_path)
             sys.exit(1)
-        
-        # 显示当前状态
-        current_score = check_result.get("score", 0)
-        print(f"📊 当前得分: {current_score:.2f}/{TARGET_SCORE}")
-        print(f"🎯 距离目标还差: {TARGET_SCORE - current_score:.2f}")
-        
-        if iteration < MAX_ITERATIONS:
-            print(f"\n⏳ 等待2秒后进入下一次迭代...")
-            import time
-            time.sleep(2)
     
-    # 达到最大迭代次数
-    print("\n" + "=" * 70)
-    print("❌ 已达到最大迭代次数，FAQ完整性仍未达到目标")
-    print(f"最终得分: {check_result.get('score', 0):.2f}/{TARGET_SCORE}")
-    print("建议手动检查并补充缺失内容")
-    print("=" * 70)
-    sys.exit(1)
+    if args.manifest:
+        sys.exit(0 if run_manifest(args) else 1)
+    
+    outcome = process_one(args.faq_file, args.source_file, args.type,
+                          target_score=args.target_score,
+                          max_iterations=args.max_iterations,
+                          use_subprocess=args.subprocess,
+                          pause_seconds=args.pause_seconds)
+    sys.exit(0 if outcome["passed"] else 1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,15 +3,29 @@
 """
 FAQ完整性检查清单
 用于验证从文档生成的FAQ是否完整覆盖了关键内容
+
+大小写约定：check_completeness 对源文档和FAQ文本各做一次 str.casefold()，
+匹配模式在构建时同样 casefold；内部匹配方法只接收已 casefold 的文本，不再各自转换大小写。
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Set, FrozenSet, Tuple
 import json
 import re
 import sys
 import argparse
 import os
 import logging
+import multiprocessing
+import functools
+import bisect
+import contextlib
+import gzip
+import hashlib
+import io
+import signal
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -23,12 +37,108 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PDF解析后端，按优先级依次尝试：
+#   PyMuPDF（C实现，速度快且版面保真度高）→ pdfminer.six（整篇流式提取）→ PyPDF2
+fitz = None
+PDF_BACKEND = None
+try:
+    import pymupdf as fitz
+    PDF_BACKEND = "pymupdf"
+except ImportError:
+    try:
+        import fitz
+        PDF_BACKEND = "pymupdf"
+    except ImportError:
+        pass
+
+if PDF_BACKEND is None:
+    try:
+        from pdfminer.high_level import extract_text as pdfminer_extract_text
+        from pdfminer.layout import LAParams
+        PDF_BACKEND = "pdfminer"
+    except ImportError:
+        pass
+
+if PDF_BACKEND is None:
+    try:
+        import PyPDF2
+        PDF_BACKEND = "pypdf2"
+    except ImportError:
+        pass
+
+PDF_SUPPORT = PDF_BACKEND is not None
+if not PDF_SUPPORT:
+    logger.warning("PyMuPDF未安装，PDF文件支持将不可用。请运行: pip install pymupdf（或 pip install pdfminer.six / PyPDF2）")
+
+try:
+    import zstandard
+    ZSTD_SUPPORT = True
+except ImportError:
+    # 未安装 zstandard 时缓存文件改用 gzip 压缩
+    ZSTD_SUPPORT = False
+
+try:
+    from tqdm import tqdm
+    TQDM_SUPPORT = True
+except ImportError:
+    TQDM_SUPPORT = False
+
+# PDF提取结果的磁盘缓存目录及格式版本（缓存结构变化时递增版本号使旧缓存失效）
+_PDF_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "faq_checker"
+)
+_PDF_CACHE_VERSION = 1
+
+# 整篇流式提取的超时时间（秒），防止个别异常页面卡住整个检查
+_PDF_TIMEOUT_SECONDS = 60
+
+# 页数达到该值且有多个CPU时使用多进程并行提取，每个工作进程处理一段连续页面
+_PARALLEL_PAGE_THRESHOLD = 16
+
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    # 未安装 pyahocorasick 时退回逐个模式的子串查找，结果相同
+    AHOCORASICK_SUPPORT = False
+
 try:
-    import PyPDF2
-    PDF_SUPPORT = True
+    import jieba
+    JIEBA_SUPPORT = True
 except ImportError:
-    PDF_SUPPORT = False
-    logger.warning("PyPDF2未安装，PDF文件支持将不可用。请运行: pip install PyPDF2")
+    # 未安装 jieba 时退回正则分词（中文会按连续字符整段切分，精度较低）
+    JIEBA_SUPPORT = False
+
+# 拼接多个FAQ文本时使用的分隔符，保证模式不会跨越两段文本匹配
+_TEXT_SEPARATOR = "\x01"
+
+# FAQ格式：### Qxx: 问题标题 / **A:** 答案
+_FAQ_RE = re.compile(r'### Q\d+:\s*(.+?)\n\*\*A:\*\*\s*(.+?)(?=\n\n### Q|\n\n---|\Z)', re.DOTALL)
+
+# 单词切分
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# 关键词提取时过滤的停用词
+_STOP = frozenset({'的', '了', '和', '是', '在', '有', '我', '你', '他', '她', '它', '们', '这', '那', '个',
+                   '一', '二', '三', '四', '五', '六', '七', '八', '九', '十'})
+
+# 关键点变体表：关键点中包含触发词时，同时匹配其同义词、近义词
+_VARIANTS = (
+    ("解除", ("辞退", "终止", "结束")),
+    ("合同", ("协议", "合约")),
+    ("条件", ("要求", "标准")),
+)
+
+# 章节标题模式，如："一、" "3.1 " "A." "第一章"（允许行首空白）
+_SECTION_RE = re.compile(r'(?m)^[ \t]*(?:[一二三四五六七八九十]+、|\d+\.\d+\s|[A-Z]\.|第[一二三四五六七八九十]+章)')
+
+
+def _tokenize(text: str) -> List[str]:
+    """分词：优先使用 jieba 中文分词，未安装时退回正则切分"""
+    if JIEBA_SUPPORT:
+        return [word for word in jieba.cut(text) if word.strip()]
+    return _WORD_RE.findall(text)
 
 
 class DocumentType(Enum):
@@ -39,6 +149,41 @@ class DocumentType(Enum):
     PRODUCT_MANUAL = "product_manual"
 
 
+# 检查清单模板：模块加载时构建一次，所有检查器实例共享（只读）
+_CHECKLIST_TEMPLATES: Dict[str, Any] = {
+    DocumentType.EMPLOYEE_HANDBOOK.value: {
+        "name": "员工手册检查清单",
+        "sections": [
+            {"name": "公司概况", "priority": "high", "key_points": ["公司介绍", "企业文化", "业务范围"]},
+            {"name": "总则", "priority": "high", "key_points": ["适用范围", "员工定义", "手册效力"]},
+            {"name": "员工聘用", "priority": "high", "key_points": ["聘用原则", "招聘流程", "入职材料"]},
+            {"name": "劳动合同", "priority": "high", "key_points": ["合同类型", "签订要求", "特殊情形"]},
+            {"name": "试用期管理", "priority": "high", "key_points": ["试用期期限", "考核标准", "不符合录用条件"]},
+            {"name": "考勤休假", "priority": "high", "key_points": ["工作时间", "考勤方式", "迟到早退", "旷工", "各类假期"]},
+            {"name": "劳动合同解除", "priority": "medium", "key_points": ["解除条件", "解除流程", "经济补偿"]},
+            {"name": "奖惩管理", "priority": "medium", "key_points": ["奖励类型", "处罚类型", "适用情形"]},
+            {"name": "廉洁承诺", "priority": "high", "key_points": ["行为规范", "禁止行为", "举报方式"]},
+            {"name": "入职指引", "priority": "high", "key_points": ["办理事项", "系统登录", "信息采集"]},
+            {"name": "薪酬福利", "priority": "high", "key_points": ["薪资结构", "五险一金", "商业保险", "薪资发放"]}
+        ],
+        "min_faq_count": 30,
+        "coverage_threshold": 0.8
+    },
+    DocumentType.POLICY_DOCUMENT.value: {
+        "name": "政策文档检查清单",
+        "sections": [
+            {"name": "政策目的", "priority": "high", "key_points": ["制定背景", "适用范围", "政策目标"]},
+            {"name": "政策内容", "priority": "high", "key_points": ["核心条款", "执行标准", "例外情况"]},
+            {"name": "执行流程", "priority": "high", "key_points": ["申请流程", "审批流程", "操作流程"]},
+            {"name": "责任分工", "priority": "medium", "key_points": ["部门职责", "岗位职责", "监督责任"]},
+            {"name": "违规处理", "priority": "medium", "key_points": ["违规情形", "处理措施", "申诉渠道"]}
+        ],
+        "min_faq_count": 15,
+        "coverage_threshold": 0.85
+    }
+}
+
+
 @dataclass
 class CompletenessCheckResult:
     """完整性检查结果"""
@@ -64,52 +209,82 @@ class CompletenessCheckResult:
             self.uncovered_section_names = []
 
 
+class MultiPatternMatcher:
+    """多模式匹配器：一次扫描文本，找出其中出现过的所有模式"""
+    
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(dict.fromkeys(p for p in patterns if p))
+        self._automaton = None
+        self._regex = None
+        if AHOCORASICK_SUPPORT and self.patterns:
+            automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif self.patterns:
+            # 无 pyahocorasick 时编译为一个交替正则：零宽前瞻在每个位置尝试匹配，长模式优先，
+            # 同一位置上被长模式遮住的短模式通过包含关系闭包补回
+            ordered = sorted(self.patterns, key=len, reverse=True)
+            self._regex = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+            self._contained = {
+                pattern: frozenset(other for other in self.patterns if other in pattern)
+                for pattern in self.patterns
+            }
+    
+    def find_all(self, text: str) -> Set[str]:
+        """返回在文本中出现过的模式集合"""
+        if not text or not self.patterns:
+            return set()
+        if self._automaton is not None:
+            return {pattern for _, pattern in self._automaton.iter(text)}
+        hits = set()
+        contained = self._contained
+        for longest in {m.group(1) for m in self._regex.finditer(text)}:
+            hits |= contained[longest]
+        return hits
+
+
 class FAQCompletenessChecker:
     """FAQ完整性检查器"""
     
     def __init__(self):
-        self.checklist_templates = self._load_checklist_templates()
+        self.checklist_templates = _CHECKLIST_TEMPLATES
         self.stats = {
             "total_faqs": 0,
             "sections_checked": 0,
             "key_points_checked": 0
         }
-    
-    def _load_checklist_templates(self) -> Dict[str, Any]:
-        """加载检查清单模板"""
-        return {
-            DocumentType.EMPLOYEE_HANDBOOK.value: {
-                "name": "员工手册检查清单",
-                "sections": [
-                    {"name": "公司概况", "priority": "high", "key_points": ["公司介绍", "企业文化", "业务范围"]},
-                    {"name": "总则", "priority": "high", "key_points": ["适用范围", "员工定义", "手册效力"]},
-                    {"name": "员工聘用", "priority": "high", "key_points": ["聘用原则", "招聘流程", "入职材料"]},
-                    {"name": "劳动合同", "priority": "high", "key_points": ["合同类型", "签订要求", "特殊情形"]},
-                    {"name": "试用期管理", "priority": "high", "key_points": ["试用期期限", "考核标准", "不符合录用条件"]},
-                    {"name": "考勤休假", "priority": "high", "key_points": ["工作时间", "考勤方式", "迟到早退", "旷工", "各类假期"]},
-                    {"name": "劳动合同解除", "priority": "medium", "key_points": ["解除条件", "解除流程", "经济补偿"]},
-                    {"name": "奖惩管理", "priority": "medium", "key_points": ["奖励类型", "处罚类型", "适用情形"]},
-                    {"name": "廉洁承诺", "priority": "high", "key_points": ["行为规范", "禁止行为", "举报方式"]},
-                    {"name": "入职指引", "priority": "high", "key_points": ["办理事项", "系统登录", "信息采集"]},
-                    {"name": "薪酬福利", "priority": "high", "key_points": ["薪资结构", "五险一金", "商业保险", "薪资发放"]}
-                ],
-                "min_faq_count": 30,
-                "coverage_threshold": 0.8
-            },
-            DocumentType.POLICY_DOCUMENT.value: {
-                "name": "政策文档检查清单",
-                "sections": [
-                    {"name": "政策目的", "priority": "high", "key_points": ["制定背景", "适用范围", "政策目标"]},
-                    {"name": "政策内容", "priority": "high", "key_points": ["核心条款", "执行标准", "例外情况"]},
-                    {"name": "执行流程", "priority": "high", "key_points": ["申请流程", "审批流程", "操作流程"]},
-                    {"name": "责任分工", "priority": "medium", "key_points": ["部门职责", "岗位职责", "监督责任"]},
-                    {"name": "违规处理", "priority": "medium", "key_points": ["违规情形", "处理措施", "申诉渠道"]}
-                ],
-                "min_faq_count": 15,
-                "coverage_threshold": 0.85
-            }
+        # 最近一次检查的源文档；深度检查用到的章节标题偏移和FAQ分词结果在首次使用时才计算
+        self._src_content = None
+        self._section_starts: Optional[List[int]] = None
+        self._tokenized_faqs: Optional[List[Dict]] = None
+        self._faq_tokens: List[Set[str]] = []
+        # 模板固定不变，章节名称分词结果和关键点变体集合只需计算一次
+        all_sections = [section for template in self.checklist_templates.values()
+                        for section in template["sections"]]
+        self._section_tokens: Dict[str, Tuple[str, ...]] = {
+            section["name"]: self._tokenize_name(section["name"]) for section in all_sections
+        }
+        self._variant_sets: Dict[str, FrozenSet[str]] = {
+            key_point: frozenset(self._key_point_patterns(key_point))
+            for section in all_sections for key_point in section.get("key_points", [])
+        }
+        # 为每种文档类型预先构建包含全部章节关键词和关键点变体的匹配器
+        self._matchers = {
+            doc_type: self._build_matcher(template["sections"])
+            for doc_type, template in self.checklist_templates.items()
         }
     
+    def _build_matcher(self, sections: List[Dict]) -> MultiPatternMatcher:
+        """收集章节关键词和关键点变体，构建多模式匹配器"""
+        patterns = []
+        for section in sections:
+            patterns.extend(self._section_tokens[section["name"]])
+            for key_point in section.get("key_points", []):
+                patterns.extend(self._variant_sets[key_point])
+        return MultiPatternMatcher(patterns)
+    
     def check_completeness(self, document_type: str, faq_data: List[Dict], 
                           source_content: str) -> CompletenessCheckResult:
         """
@@ -128,11 +303,25 @@ class FAQCompletenessChecker:
         
         template = self.checklist_templates[document_type]
         
+        # 对全部FAQ文本和源文档各扫描一次，得到出现过的章节关键词和关键点变体
+        matcher = self._matchers[document_type]
+        faq_text = _TEXT_SEPARATOR.join(
+            f"{faq.get('question', '')}{_TEXT_SEPARATOR}{faq.get('answer', '')}"
+            for faq in faq_data
+        )
+        faq_hits = matcher.find_all(faq_text.casefold())
+        
+        # 源文档的 casefold 文本只计算一次
+        self._src_content = source_content
+        self._section_starts = None
+        self._tokenized_faqs = None
+        source_hits = matcher.find_all(source_content.casefold())
+        
         # 分析章节覆盖情况
-        section_coverage = self._check_section_coverage(template["sections"], faq_data, source_content)
+        section_coverage = self._check_section_coverage(template["sections"], faq_hits, source_hits)
         
         # 分析关键点覆盖情况
-        key_point_coverage = self._check_key_point_coverage(template["sections"], faq_data, source_content)
+        key_point_coverage = self._check_key_point_coverage(template["sections"], faq_hits, source_hits)
         
         # 检查FAQ数量
         faq_count = len(faq_data)
@@ -181,23 +370,27 @@ class FAQCompletenessChecker:
             uncovered_section_names=section_coverage.get("uncovered_sections", [])
         )
     
-    def _check_section_coverage(self, sections: List[Dict], faq_data: List[Dict], 
-                               source_content: str) -> Dict[str, Any]:
-        """检查章节覆盖情况"""
+    def _check_section_coverage(self, sections: List[Dict], faq_hits: Set[str],
+                               source_hits: Set[str]) -> Dict[str, Any]:
+        """
+        检查章节覆盖情况
+        
+        Args:
+            sections: 章节配置列表
+            faq_hits: 在FAQ文本中出现过的模式集合
+            source_hits: 在源文档中出现过的模式集合
+        """
         covered_sections = []
         uncovered_sections = []
         
         for section in sections:
             section_name = section["name"]
+            keywords = self._section_tokens[section_name]
             # 检查FAQ中是否提及该章节
-            section_mentioned = any(
-                self._is_section_mentioned(section_name, faq.get("question", "")) or
-                self._is_section_mentioned(section_name, faq.get("answer", ""))
-                for faq in faq_data
-            )
+            section_mentioned = any(keyword in faq_hits for keyword in keywords)
             
             # 检查源文档中是否有相关内容
-            content_exists = self._is_section_mentioned(section_name, source_content)
+            content_exists = any(keyword in source_hits for keyword in keywords)
             
             if section_mentioned and content_exists:
                 covered_sections.append(section_name)
@@ -212,9 +405,16 @@ class FAQCompletenessChecker:
             "uncovered_sections": uncovered_sections
         }
     
-    def _check_key_point_coverage(self, sections: List[Dict], faq_data: List[Dict],
-                                 source_content: str) -> Dict[str, Any]:
-        """检查关键点覆盖情况"""
+    def _check_key_point_coverage(self, sections: List[Dict], faq_hits: Set[str],
+                                 source_hits: Set[str]) -> Dict[str, Any]:
+        """
+        检查关键点覆盖情况
+        
+        Args:
+            sections: 章节配置列表
+            faq_hits: 在FAQ文本中出现过的模式集合
+            source_hits: 在源文档中出现过的模式集合
+        """
         total_key_points = 0
         covered_key_points = 0
         coverage_details = []
@@ -222,16 +422,13 @@ class FAQCompletenessChecker:
         for section in sections:
             for key_point in section.get("key_points", []):
                 total_key_points += 1
+                variants = self._variant_sets[key_point]
                 
                 # 检查FAQ中是否提及该关键点
-                key_point_mentioned = any(
-                    self._is_key_point_mentioned(key_point, faq.get("question", "")) or
-                    self._is_key_point_mentioned(key_point, faq.get("answer", ""))
-                    for faq in faq_data
-                )
+                key_point_mentioned = not variants.isdisjoint(faq_hits)
                 
                 # 检查源文档中是否有相关内容
-                content_exists = self._is_key_point_mentioned(key_point, source_content)
+                content_exists = not variants.isdisjoint(source_hits)
                 
                 if key_point_mentioned and content_exists:
                     covered_key_points += 1
@@ -248,39 +445,23 @@ class FAQCompletenessChecker:
     
     def _check_priority_coverage(self, sections: List[Dict], 
                                 section_coverage: Dict[str, Any]) -> Dict[str, bool]:
-        """检查优先级覆盖情况"""
-        priority_coverage = {"high": True, "medium": True, "low": True}
-        
+        """检查优先级覆盖情况：某优先级下没有未覆盖章节即视为该优先级已覆盖"""
+        # 按优先级一次性分桶，再与未覆盖章节集合求交
+        priority_buckets = {"high": set(), "medium": set(), "low": set()}
         for section in sections:
-            priority = section.get("priority", "medium")
-            section_name = section["name"]
-            
-            if section_name in section_coverage.get("uncovered_sections", []):
-                if priority == "high":
-                    priority_coverage["high"] = False
-                elif priority == "medium":
-                    priority_coverage["medium"] = False
+            priority_buckets.setdefault(section.get("priority", "medium"), set()).add(section["name"])
         
-        return priority_coverage
+        uncovered = set(section_coverage.get("uncovered_sections", []))
+        return {priority: priority_buckets[priority].isdisjoint(uncovered)
+                for priority in ("high", "medium", "low")}
     
-    def _is_section_mentioned(self, section_name: str, text: str) -> bool:
-        """检查章节是否在文本中被提及"""
-        if not text or not section_name:
-            return False
-        
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _tokenize_name(section_name: str) -> Tuple[str, ...]:
+        """将章节名称拆分为用于匹配的关键词（casefold），每个名称只拆分一次"""
         # 简化的匹配逻辑，实际应用中可以使用更复杂的NLP技术
         keywords = section_name.replace("、", " ").replace("，", " ").replace("：", " ").split()
-        keywords = [kw.strip() for kw in keywords if kw.strip()]
-        
-        if not keywords:
-            return False
-        
-        # 检查是否有任何关键词在文本中出现
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
-        return False
+        return tuple(kw.strip().casefold() for kw in keywords if kw.strip())
     
     def _is_section_content_covered(self, section: Dict, faq_data: List[Dict],
                                    source_content: str) -> bool:
@@ -297,113 +478,87 @@ class FAQCompletenessChecker:
         section_keywords = self._extract_section_keywords(section_name, section_content)
         
         # 检查是否有FAQ涉及这些核心概念
-        for faq in faq_data:
-            faq_text = f"{faq.get('question', '')} {faq.get('answer', '')}"
-            if self._has_concept_overlap(faq_text, section_keywords):
+        for faq_tokens in self._faq_token_sets(faq_data):
+            if self._has_concept_overlap(faq_tokens, section_keywords):
                 return True
         
         return False
     
     def _extract_section_content(self, section_name: str, source_content: str) -> str:
-        """从源文档中提取指定章节的内容"""
-        # 简化的章节提取逻辑
-        # 实际应用中可以使用更复杂的文本分割算法
-        lines = source_content.split('\n')
-        section_lines = []
-        in_section = False
-        
-        for i, line in enumerate(lines):
-            if section_name in line:
-                in_section = True
-                section_lines.append(line)
-            elif in_section and i < len(lines) - 1:
-                # 检查下一行是否是新的章节开始
-                next_line = lines[i + 1]
-                if self._is_new_section_start(next_line):
-                    break
-                section_lines.append(line)
-        
-        return '\n'.join(section_lines)
-    
-    def _is_new_section_start(self, line: str) -> bool:
-        """判断一行是否是新章节的开始"""
-        # 检查是否匹配章节标题模式，如："一、" "二、" "三、" 或 "1." "2." "3."
-        patterns = [
-            r'^[一二三四五六七八九十]+、',  # 中文数字章节
-            r'^\d+\.\d+\s',  # 数字章节，如 3.1
-            r'^[A-Z]\.',  # 字母章节，如 A.
-            r'^第[一二三四五六七八九十]+章',  # "第一章"格式
-        ]
+        """从源文档中提取指定章节的内容：从首次提及章节名的行开始，到下一个章节标题为止"""
+        pos = source_content.find(section_name)
+        if pos < 0:
+            return ""
+        start = source_content.rfind('\n', 0, pos) + 1
         
-        for pattern in patterns:
-            if re.match(pattern, line.strip()):
-                return True
-        return False
+        starts = self._section_start_offsets(source_content)
+        idx = bisect.bisect_right(starts, start)
+        end = starts[idx] if idx < len(starts) else len(source_content)
+        return source_content[start:end].rstrip('\n')
+    
+    def _section_start_offsets(self, source_content: str) -> List[int]:
+        """源文档中各章节标题的起始偏移，本次检查的源文档只扫描一次"""
+        if source_content is not self._src_content:
+            return [m.start() for m in _SECTION_RE.finditer(source_content)]
+        if self._section_starts is None:
+            self._section_starts = [m.start() for m in _SECTION_RE.finditer(source_content)]
+        return self._section_starts
+    
+    def _faq_token_sets(self, faq_data: List[Dict]) -> List[Set[str]]:
+        """各FAQ问答文本（casefold）的分词集合，同一批FAQ只分词一次"""
+        if faq_data is not self._tokenized_faqs:
+            self._faq_tokens = [
+                set(_tokenize(f"{faq.get('question', '')} {faq.get('answer', '')}".casefold()))
+                for faq in faq_data
+            ]
+            self._tokenized_faqs = faq_data
+        return self._faq_tokens
     
-    def _extract_section_keywords(self, section_name: str, section_content: str) -> List[str]:
-        """提取章节的核心关键词"""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _extract_section_keywords(section_name: str, section_content: str) -> FrozenSet[str]:
+        """提取章节的核心关键词（casefold），相同章节内容的重复查询直接复用结果"""
         keywords = []
         
         # 添加章节名称作为关键词
-        keywords.extend(section_name.replace("、", " ").split())
+        keywords.extend(word.casefold() for word in section_name.replace("、", " ").split())
         
         # 从内容中提取高频词和关键短语
-        words = re.findall(r'\b\w+\b', section_content.lower())
         # 过滤停用词
-        stop_words = {'的', '了', '和', '是', '在', '有', '我', '你', '他', '她', '它', '们', '这', '那', '个', '一', '二', '三', '四', '五', '六', '七', '八', '九', '十'}
-        meaningful_words = [word for word in words if word not in stop_words and len(word) > 1]
+        meaningful_words = [word for word in _tokenize(section_content.casefold())
+                            if len(word) > 1 and word not in _STOP]
         
         # 统计词频，取前10个高频词
-        from collections import Counter
         word_counts = Counter(meaningful_words)
         top_words = [word for word, count in word_counts.most_common(10)]
         
         keywords.extend(top_words)
         
-        # 去重
-        return list(set(keywords))
+        return frozenset(keywords)
     
-    def _has_concept_overlap(self, faq_text: str, section_keywords: List[str]) -> bool:
-        """检查FAQ文本是否与章节关键词有概念重叠"""
-        faq_text_lower = faq_text.lower()
-        
-        # 检查是否有任何关键词在FAQ中出现
-        for keyword in section_keywords:
-            if keyword.lower() in faq_text_lower:
-                return True
-        
+    def _has_concept_overlap(self, faq_tokens: Set[str], section_keywords: FrozenSet[str]) -> bool:
+        """检查FAQ词集合是否与章节关键词集合有概念重叠（均已 casefold）"""
         # 检查语义相似性（简化版）
         # 实际应用中可以使用词向量或预训练语言模型
-        return False
+        return not faq_tokens.isdisjoint(section_keywords)
     
-    def _is_key_point_mentioned(self, key_point: str, text: str) -> bool:
-        """检查关键点是否在文本中被提及"""
-        if not text or not key_point:
-            return False
-        
+    def _key_point_patterns(self, key_point: str) -> List[str]:
+        """关键点及其变体形式（casefold），用于匹配"""
+        if not key_point:
+            return []
         # 扩展匹配逻辑：支持同义词和近义词
-        key_point_variants = self._generate_key_point_variants(key_point)
-        
-        text_lower = text.lower()
-        for variant in key_point_variants:
-            if variant.lower() in text_lower:
-                return True
-        
-        return False
+        return [variant.casefold() for variant in self._generate_key_point_variants(key_point)]
     
     def _generate_key_point_variants(self, key_point: str) -> List[str]:
         """生成关键点的变体形式（同义词、近义词）"""
         variants = [key_point]
         
         # 添加常见变体
-        if "解除" in key_point:
-            variants.extend(["辞退", "终止", "结束"])
-        if "合同" in key_point:
-            variants.extend(["协议", "合约"])
-        if "条件" in key_point:
-            variants.extend(["要求", "标准"])
+        for trigger, synonyms in _VARIANTS:
+            if trigger in key_point:
+                variants.extend(synonyms)
         
-        return list(set(variants))
+        return list(dict.fromkeys(variants))
     
     def get_detailed_stats(self) -> Dict[str, Any]:
         """获取详细统计信息"""
@@ -497,22 +652,14 @@ def parse_faq_file(faq_file_path: str) -> List[Dict[str, str]]:
             logger.warning(f"FAQ文件为空: {faq_file_path}")
             return []
         
-        faq_data = []
-        # 匹配FAQ格式：### Qxx: 问题标题
-        faq_pattern = r'### Q\d+:\s*(.+?)\n\*\*A:\*\*\s*(.+?)(?=\n\n### Q|\n\n---|\Z)'
-        matches = re.findall(faq_pattern, content, re.DOTALL)
-        
-        logger.info(f"从FAQ文件中提取到 {len(matches)} 个问答对")
+        # 匹配FAQ格式：### Qxx: 问题标题；逐个匹配并清理空白，问题和答案都不为空才保留
+        faq_data = [
+            {"question": question, "answer": answer}
+            for m in _FAQ_RE.finditer(content)
+            if (question := m.group(1).strip()) and (answer := m.group(2).strip())
+        ]
         
-        for question, answer in matches:
-            # 清理多余的空白字符
-            question = question.strip()
-            answer = answer.strip()
-            if question and answer:  # 确保问题和答案都不为空
-                faq_data.append({
-                    "question": question,
-                    "answer": answer
-                })
+        logger.info(f"从FAQ文件中提取到 {len(faq_data)} 个问答对")
         
         if not faq_data:
             logger.warning(f"未能从文件中提取任何FAQ: {faq_file_path}")
@@ -527,52 +674,220 @@ def parse_faq_file(faq_file_path: str) -> List[Dict[str, str]]:
         return []
 
 
-def parse_pdf_file(pdf_file_path: str) -> str:
+class PDFTimeoutError(Exception):
+    """PDF解析超时"""
+    pass
+
+
+@contextlib.contextmanager
+def _pdf_timeout(seconds: int):
+    """基于 SIGALRM 的超时保护；不支持 SIGALRM 或不在主线程时不做限制"""
+    if not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
+    def _timeout(signum, frame):
+        raise PDFTimeoutError(f"PDF解析超过 {seconds} 秒")
+    
+    previous = signal.signal(signal.SIGALRM, _timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _parse_pdf_pdfminer(pdf_file_path: str) -> str:
+    """使用 pdfminer 整篇流式提取文本，文本直接写入其内部输出设备，无需逐页拼接"""
+    with _pdf_timeout(_PDF_TIMEOUT_SECONDS):
+        return pdfminer_extract_text(pdf_file_path, laparams=LAParams(), maxpages=0, caching=True)
+
+
+def _pdf_page_count(pdf_file_path: str) -> int:
+    """获取PDF页数"""
+    if PDF_BACKEND == "pymupdf":
+        with fitz.open(pdf_file_path) as doc:
+            return doc.page_count
+    with open(pdf_file_path, 'rb') as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def _iter_page_texts(pdf_file_path: str, start: int, stop: int) -> Iterator[Tuple[int, str, Optional[str]]]:
+    """
+    逐页提取 [start, stop) 范围内的文本，整个范围只打开一次文档
+    
+    Yields:
+        (页码, 文本, 错误信息)
+    """
+    if PDF_BACKEND == "pymupdf":
+        with fitz.open(pdf_file_path) as doc:
+            for page_num in range(start, stop):
+                try:
+                    yield page_num, doc[page_num].get_text("text"), None
+                except Exception as e:
+                    yield page_num, "", str(e)
+    else:
+        with open(pdf_file_path, 'rb') as f:
+            pdf_reader = PyPDF2.PdfReader(f)
+            for page_num in range(start, stop):
+                try:
+                    yield page_num, pdf_reader.pages[page_num].extract_text(), None
+                except Exception as e:
+                    yield page_num, "", str(e)
+
+
+def _extract_page_range(task: Tuple[str, int, int]) -> List[Tuple[int, str, Optional[str]]]:
+    """
+    提取一段连续页面的文本（进程池任务，需在模块顶层定义）
+    
+    文档对象无法跨进程传递，因此在工作进程内重新打开文件，每个任务只打开一次
+    """
+    return list(_iter_page_texts(*task))
+
+
+def _parallel_workers(n_pages: int) -> int:
+    """
+    PDF并行提取使用的进程数，返回1表示串行提取
+    
+    页数较少、只有一个CPU，或本身已在进程池工作进程中（如 --batch 批量检查）时不再开进程池，
+    避免启动开销和进程数成倍膨胀
+    """
+    cpu_count = os.cpu_count() or 1
+    if n_pages < _PARALLEL_PAGE_THRESHOLD or cpu_count <= 1 \
+            or multiprocessing.parent_process() is not None:
+        return 1
+    return min(cpu_count, n_pages)
+
+
+def parse_pdf_file(pdf_file_path: str, show_progress: bool = False) -> str:
     """
     解析PDF文件，提取文本内容
     
+    默认使用 PyMuPDF，未安装时依次退回 pdfminer（整篇流式提取）和 PyPDF2；
+    逐页提取的后端在页数较多且有多个CPU时，把页面均分为与进程数相同的连续页段并行提取，
+    各页文本按顺序直接写入同一缓冲区
+    
     Args:
         pdf_file_path: PDF文件路径
+        show_progress: 是否显示提取进度条（需安装 tqdm）
         
     Returns:
         PDF文本内容
     """
     if not PDF_SUPPORT:
-        logger.error("PyPDF2未安装，无法读取PDF文件。请运行: pip install PyPDF2")
+        logger.error("PyMuPDF未安装，无法读取PDF文件。请运行: pip install pymupdf（或 pip install pdfminer.six / PyPDF2）")
         return ""
     
     try:
-        with open(pdf_file_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text_content = []
-            
-            logger.info(f"PDF文件共有 {len(pdf_reader.pages)} 页")
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                    else:
-                        logger.warning(f"第 {page_num + 1} 页未能提取文本")
-                except Exception as e:
-                    logger.warning(f"提取第 {page_num + 1} 页文本时出错: {e}")
-            
-            full_text = "\n".join(text_content)
+        if PDF_BACKEND == "pdfminer":
+            full_text = _parse_pdf_pdfminer(pdf_file_path)
             logger.info(f"成功提取 {len(full_text)} 个字符")
             return full_text
+        
+        n_pages = _pdf_page_count(pdf_file_path)
+        logger.info(f"PDF文件共有 {n_pages} 页")
+        
+        workers = _parallel_workers(n_pages)
+        with contextlib.ExitStack() as stack:
+            if workers == 1:
+                # 串行提取：整篇只打开一次，逐页读取
+                pages = _iter_page_texts(pdf_file_path, 0, n_pages)
+                if show_progress and TQDM_SUPPORT:
+                    pages = tqdm(pages, total=n_pages, desc="提取PDF文本", unit="页")
+            else:
+                # 每个工作进程处理一段连续页面，只打开一次文档
+                step = -(-n_pages // workers)
+                tasks = [(pdf_file_path, start, min(start + step, n_pages))
+                         for start in range(0, n_pages, step)]
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                # executor.map 按任务顺序返回结果，页面顺序与原文一致
+                chunks = executor.map(_extract_page_range, tasks)
+                if show_progress and TQDM_SUPPORT:
+                    chunks = tqdm(chunks, total=len(tasks), desc="提取PDF文本", unit="段")
+                pages = (page for chunk in chunks for page in chunk)
+            
+            buf = io.StringIO()
+            has_text = False
+            for page_num, page_text, error in pages:
+                if error:
+                    logger.warning(f"提取第 {page_num + 1} 页文本时出错: {error}")
+                elif page_text:
+                    if has_text:
+                        buf.write("\n")
+                    buf.write(page_text)
+                    has_text = True
+                else:
+                    logger.warning(f"第 {page_num + 1} 页未能提取文本")
+        
+        full_text = buf.getvalue()
+        logger.info(f"成功提取 {len(full_text)} 个字符")
+        return full_text
     
     except Exception as e:
         logger.error(f"读取PDF文件失败: {e}")
         return ""
 
 
-def parse_source_file(source_file_path: str) -> str:
+def _pdf_cache_path(pdf_file_path: str) -> str:
+    """按PDF文件内容的 blake2b 摘要计算缓存文件路径"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    suffix = ".json.zst" if ZSTD_SUPPORT else ".json.gz"
+    return os.path.join(_PDF_CACHE_DIR, digest.hexdigest() + suffix)
+
+
+def _load_pdf_cache(cache_path: str) -> Optional[str]:
+    """读取缓存的PDF文本，缓存不存在、损坏或版本不符时返回 None"""
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        if ZSTD_SUPPORT:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            data = gzip.decompress(data)
+        payload = json.loads(data)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"PDF缓存读取失败，将重新解析: {e}")
+        return None
+    # 不同解析后端提取的文本不同，后端变化后不复用旧缓存
+    if payload.get("version") != _PDF_CACHE_VERSION or payload.get("backend") != PDF_BACKEND:
+        return None
+    return payload.get("text")
+
+
+def _save_pdf_cache(cache_path: str, text: str) -> None:
+    """写入PDF文本缓存（先写临时文件再替换，避免并发读到半截文件）"""
+    data = json.dumps({"version": _PDF_CACHE_VERSION, "backend": PDF_BACKEND, "text": text}, ensure_ascii=False).encode('utf-8')
+    if ZSTD_SUPPORT:
+        data = zstandard.ZstdCompressor().compress(data)
+    else:
+        data = gzip.compress(data)
+    try:
+        os.makedirs(_PDF_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"PDF缓存写入失败: {e}")
+
+
+def parse_source_file(source_file_path: str, use_cache: bool = True,
+                      show_progress: bool = False) -> str:
     """
     解析源文档文件（支持PDF和文本格式）
     
+    PDF的提取结果按文件内容摘要缓存在磁盘上，同一文件再次检查时直接读取缓存
+    
     Args:
         source_file_path: 源文档路径
+        use_cache: 是否使用PDF提取结果的磁盘缓存
+        show_progress: 解析PDF时是否显示进度条
         
     Returns:
         源文档内容
@@ -586,7 +901,19 @@ def parse_source_file(source_file_path: str) -> str:
     
     if file_ext == '.pdf':
         logger.info(f"检测到PDF文件，使用PDF解析器: {source_file_path}")
-        return parse_pdf_file(source_file_path)
+        if not use_cache:
+            return parse_pdf_file(source_file_path, show_progress=show_progress)
+        
+        cache_path = _pdf_cache_path(source_file_path)
+        cached_text = _load_pdf_cache(cache_path)
+        if cached_text is not None:
+            logger.info(f"使用PDF缓存: {cache_path}")
+            return cached_text
+        
+        text = parse_pdf_file(source_file_path, show_progress=show_progress)
+        if text:
+            _save_pdf_cache(cache_path, text)
+        return text
     else:
         # 默认为文本文件
         try:
@@ -606,6 +933,174 @@ def parse_source_file(source_file_path: str) -> str:
             return ""
 
 
+# 解析结果缓存：(解析类型, 绝对路径) -> ((文件大小, 修改时间), 解析结果)
+# 每个文件只保留最新一份，文件变化（大小或修改时间不同）时重新解析
+_parse_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+def _cached_parse(kind: str, file_path: str, parse_func: Callable[[str], Any]) -> Any:
+    """
+    按文件状态缓存解析结果，文件未变化时直接复用上次的解析结果
+    
+    Args:
+        kind: 解析类型（区分同一文件的不同解析方式）
+        file_path: 文件路径
+        parse_func: 解析函数
+        
+    Returns:
+        解析结果
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return parse_func(file_path)
+    
+    key = (kind, os.path.abspath(file_path))
+    stamp = (st.st_size, st.st_mtime_ns)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        logger.debug(f"复用缓存的解析结果: {file_path}")
+        return cached[1]
+    
+    parsed = parse_func(file_path)
+    if parsed:
+        _parse_cache[key] = (stamp, parsed)
+    return parsed
+
+
+def is_check_passed(result: CompletenessCheckResult) -> bool:
+    """判断检查结果是否达到通过标准"""
+    return result.overall_score >= 0.7 and result.priority_coverage['high']
+
+
+def result_to_dict(result: CompletenessCheckResult) -> Dict[str, Any]:
+    """
+    将检查结果转换为便于其他程序使用的字典（与 --debug 输出的JSON结构一致）
+    
+    Args:
+        result: 完整性检查结果
+        
+    Returns:
+        结果字典
+    """
+    return {
+        "document_type": result.document_type,
+        "overall_score": round(result.overall_score, 2),
+        "section_coverage_rate": round(result.section_coverage_rate, 2),
+        "key_point_coverage_rate": round(result.key_point_coverage_rate, 2),
+        "faq_count": result.faq_count,
+        "min_faq_count_met": result.min_faq_count_met,
+        "priority_coverage_high": result.priority_coverage['high'],
+        "covered_sections": result.covered_section_names,
+        "uncovered_sections": result.uncovered_section_names,
+        "recommendations": result.recommendations,
+        "passed": is_check_passed(result)
+    }
+
+
+def run_check(faq_file_path: str, source_file_path: str, doc_type: str) -> Dict[str, Any]:
+    """
+    在进程内执行完整性检查，供其他脚本直接导入调用
+    
+    FAQ文件和源文档的解析结果按文件状态缓存，循环调用时未变化的文件不会重复解析
+    
+    Args:
+        faq_file_path: FAQ文件路径
+        source_file_path: 源文档路径
+        doc_type: 文档类型
+        
+    Returns:
+        结果字典（结构同 result_to_dict）
+        
+    Raises:
+        ValueError: FAQ或源文档无法读取出有效内容，或文档类型不受支持
+    """
+    faq_data = _cached_parse("faq", faq_file_path, parse_faq_file)
+    if not faq_data:
+        raise ValueError("未能读取有效的FAQ数据")
+    
+    source_content = _cached_parse("source", source_file_path, parse_source_file)
+    if not source_content:
+        raise ValueError("未能读取有效的源文档内容")
+    
+    checker = FAQCompletenessChecker()
+    result = checker.check_completeness(
+        document_type=doc_type,
+        faq_data=faq_data,
+        source_content=source_content
+    )
+    return result_to_dict(result)
+
+
+def load_batch_manifest(manifest_path: str, default_type: str) -> List[Dict[str, str]]:
+    """
+    读取批量检查清单（JSON数组）
+    
+    每项格式：{"faq": FAQ文件, "source": 源文档, "type": 文档类型}，type 可省略
+    
+    Returns:
+        检查任务列表
+        
+    Raises:
+        ValueError: 清单格式错误
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError("清单文件必须是JSON数组")
+    
+    jobs = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("faq") or not entry.get("source"):
+            raise ValueError(f"清单第 {index} 项缺少 faq 或 source 字段: {entry}")
+        jobs.append({
+            "faq": entry["faq"],
+            "source": entry["source"],
+            "type": entry.get("type") or default_type
+        })
+    return jobs
+
+
+def _check_one(job: Dict[str, str]) -> Dict[str, Any]:
+    """
+    执行单个批量检查任务（作为进程池任务，需在模块顶层定义）
+    
+    Returns:
+        结果字典（结构同 result_to_dict，附带文件路径；失败时含 error 字段）
+    """
+    outcome = {"faq_file": job["faq"], "source_file": job["source"]}
+    try:
+        outcome.update(run_check(job["faq"], job["source"], job["type"]))
+    except Exception as e:
+        logger.error(f"检查失败 {job['faq']}: {e}")
+        outcome.update({"document_type": job["type"], "passed": False, "error": str(e)})
+    return outcome
+
+
+def run_batch(manifest_path: str, default_type: str, workers: Optional[int] = None) -> bool:
+    """
+    使用进程池并行检查清单中的多组文档，输出汇总JSON数组，返回是否全部通过
+    """
+    try:
+        jobs = load_batch_manifest(manifest_path, default_type)
+    except (OSError, ValueError) as e:
+        logger.error(f"无法读取清单文件: {e}")
+        print(f"❌ 错误：无法读取清单文件: {e}", file=sys.stderr)
+        return False
+    
+    if not jobs:
+        logger.warning(f"清单中没有需要检查的文档: {manifest_path}")
+        return False
+    
+    logger.info(f"清单文件: {manifest_path}（共 {len(jobs)} 组文档）")
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        results = list(executor.map(_check_one, jobs))
+    
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    
+    return all(result["passed"] for result in results)
+
+
 def main():
     """主函数：命令行用法"""
     parser = argparse.ArgumentParser(
@@ -622,25 +1117,40 @@ def main():
   # 显示详细信息和调试日志
   python faq_completeness_checklist.py 员工手册FAQ.md 员工手册.pdf --type employee_handbook --verbose
   
+  # 按清单并行检查多组文档，输出汇总JSON数组
+  python faq_completeness_checklist.py --batch manifest.json
+  # manifest.json: [{"faq": "a_FAQ.md", "source": "a.pdf", "type": "employee_handbook"}, ...]
+  
   # 显示帮助信息
   python faq_completeness_checklist.py --help
         
 依赖说明:
   - 支持Markdown格式的FAQ文件
   - 支持PDF和文本格式的源文档
-  - 如需PDF支持，请安装: pip install PyPDF2
+  - 如需PDF支持，请安装: pip install pymupdf（或 pip install pdfminer.six / PyPDF2）
+  - 如需加速关键词匹配（Aho-Corasick），可安装: pip install pyahocorasick
+  - 如需更准确的中文关键词提取，可安装: pip install jieba
+  - 安装 tqdm 后，--verbose 模式下解析大型PDF时显示进度条
+  - PDF提取结果缓存在 ~/.cache/faq_checker，安装 zstandard 可减小缓存体积（否则使用gzip）
         """
     )
     
-    parser.add_argument('faq_file', help='FAQ文件路径（Markdown格式）')
-    parser.add_argument('source_file', help='源文档路径（PDF或文本格式）')
+    parser.add_argument('faq_file', nargs='?', help='FAQ文件路径（Markdown格式）')
+    parser.add_argument('source_file', nargs='?', help='源文档路径（PDF或文本格式）')
     parser.add_argument('--type', default='employee_handbook',
                        choices=['employee_handbook', 'policy_document', 'operation_guide', 'product_manual'],
                        help='文档类型（决定检查标准和最低FAQ数量）')
     parser.add_argument('--verbose', '-v', action='store_true', help='显示详细检查信息和调试日志')
     parser.add_argument('--debug', '-d', action='store_true', help='启用调试模式（显示更多技术细节）')
+    parser.add_argument('--no-cache', action='store_true', help='不使用PDF提取结果的磁盘缓存，强制重新解析')
+    parser.add_argument('--batch', metavar='MANIFEST',
+                       help='批量检查清单（JSON数组，每项含 faq、source、可选 type），并行检查并输出汇总JSON')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='批量模式下的并行进程数（默认为CPU核数）')
     
     args = parser.parse_args()
+    if not args.batch and not (args.faq_file and args.source_file):
+        parser.error("需要指定 faq_file 和 source_file，或使用 --batch 指定清单文件")
     
     # 设置日志级别
     if args.debug:
@@ -654,6 +1164,9 @@ def main():
     logger.info("FAQ完整性检查工具启动")
     logger.info("=" * 70)
     
+    if args.batch:
+        sys.exit(0 if run_batch(args.batch, args.type, args.workers) else 1)
+    
     # 检查文件是否存在
     if not os.path.isfile(args.faq_file):
         logger.error(f"FAQ文件不存在或不是文件: {args.faq_file}")
@@ -674,7 +1187,8 @@ def main():
     faq_data = parse_faq_file(args.faq_file)
     
     logger.info("开始解析源文档...")
-    source_content = parse_source_file(args.source_file)
+    source_content = parse_source_file(args.source_file, use_cache=not args.no_cache,
+                                       show_progress=args.verbose)
     
     if not faq_data:
         logger.error("未能读取有效的FAQ数据")
@@ -735,7 +1249,7 @@ def main():
     print("=" * 70 + "\n")
     
     # 返回码
-    success = result.overall_score >= 0.7 and result.priority_coverage['high']
+    success = is_check_passed(result)
     if success:
         logger.info("完整性检查通过！")
         print("\n🎉 恭喜！FAQ完整性检查通过，达到生产级标准。")
@@ -745,20 +1259,7 @@ def main():
     
     # 输出JSON格式的详细结果，便于其他程序解析
     if args.debug:
-        import json
-        result_dict = {
-            "document_type": result.document_type,
-            "overall_score": round(result.overall_score, 2),
-            "section_coverage_rate": round(result.section_coverage_rate, 2),
-            "key_point_coverage_rate": round(result.key_point_coverage_rate, 2),
-            "faq_count": result.faq_count,
-            "min_faq_count_met": result.min_faq_count_met,
-            "priority_coverage_high": result.priority_coverage['high'],
-            "covered_sections": result.covered_section_names,
-            "uncovered_sections": result.uncovered_section_names,
-            "recommendations": result.recommendations,
-            "passed": success
-        }
+        result_dict = result_to_dict(result)
         print(f"\n📊 JSON结果:\n{json.dumps(result_dict, ensure_ascii=False, indent=2)}")
     
     sys.exit(0 if success else 1)
@@ -8,8 +8,102 @@
 import re
 import json
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Set, Iterable, Iterator, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
+
+# 词条数达到该值时改用 Aho-Corasick 自动机（需安装 pyahocorasick），否则使用正则交替
+_AHOCORASICK_MIN_TERMS = 256
+
+# 流式读取源文件时的缓冲区大小
+_READ_BUFFER_SIZE = 1 << 20
+
+# 变更记录在内存中以元组 (类型编号, 原内容, 新内容, 附加字段值) 保存，对外时再展开为字典
+_CT_TERMINOLOGY, _CT_STRUCTURE, _CT_EXPRESSION = range(3)
+_CHANGE_TYPE_NAMES = ("terminology", "structure", "expression")
+_CHANGE_EXTRA_KEYS = ("location", "line_number", "pattern_type")
+
+# 标题末尾需要去掉的标点
+_TITLE_PUNCT = frozenset('。！？,;:!?')
+
+# 列表项符号
+_LIST_MARKERS = frozenset('-*+')
+
+# 预编译的结构优化正则
+_RE_NUM = re.compile(r'^\s*\d+\.\s+')                  # 编号列表项
+_RE_NUM_SPACE = re.compile(r'^(\s*\d+)\.\s+')          # 编号后的空白
+
+
+def _find_list_marker(line: str) -> int:
+    """按前缀扫描匹配列表项（等价于 ^\\s*[-*+]\\s+），返回列表符号的位置，不是列表项时返回 -1"""
+    marker = len(line) - len(line.lstrip())
+    if line[marker:marker + 1] in _LIST_MARKERS and line[marker + 1:marker + 2].isspace():
+        return marker
+    return -1
+
+
+def _capitalize_at(text: str, start: int) -> str:
+    """将 start 位置的小写字母转为大写；无需修改时直接返回原字符串，不产生新对象"""
+    first = text[start:start + 1]
+    if first.islower():
+        return text[:start] + first.upper() + text[start + 1:]
+    return text
+
+
+class TermReplacer:
+    """多词替换器：一次扫描文本完成全部词条替换（同一位置优先匹配最长词条）"""
+    
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = {old: new for old, new in mapping.items() if old}
+        self._pattern = None
+        self._automaton = None
+        if not self.mapping:
+            return
+        if AHOCORASICK_SUPPORT and len(self.mapping) >= _AHOCORASICK_MIN_TERMS:
+            automaton = ahocorasick.Automaton()
+            for old_term in self.mapping:
+                automaton.add_word(old_term, old_term)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            terms = sorted(self.mapping, key=len, reverse=True)
+            self._pattern = re.compile('|'.join(map(re.escape, terms)))
+    
+    def replace(self, text: str, hits: Set[str]) -> str:
+        """替换文本中的全部词条，命中的原词条加入 hits"""
+        if self._pattern is not None:
+            # 先用 search 判断是否命中：未命中的行（大多数）不必创建回调、也不必走 sub
+            if self._pattern.search(text) is None:
+                return text
+            
+            def _sub(match):
+                old_term = match.group(0)
+                hits.add(old_term)
+                return self.mapping[old_term]
+            return self._pattern.sub(_sub, text)
+        
+        if self._automaton is None:
+            return text
+        
+        # iter_long 从左到右给出互不重叠的最长匹配
+        parts = []
+        last = 0
+        for end, old_term in self._automaton.iter_long(text):
+            start = end - len(old_term) + 1
+            parts.append(text[last:start])
+            parts.append(self.mapping[old_term])
+            hits.add(old_term)
+            last = end + 1
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return ''.join(parts)
 
 
 class KnowledgeFormatNormalizer:
@@ -17,7 +111,17 @@ class KnowledgeFormatNormalizer:
     
     def __init__(self, format_standards: Dict[str, Any] = None):
         self.format_standards = format_standards or self._load_default_standards()
-        self.changes = []
+        self._change_records = []
+        self.source_length = 0
+        
+        # 术语和表达替换各自预先构建为单次扫描的替换器
+        self._term_replacer = TermReplacer(self.format_standards.get("terminology", {}))
+        expression_patterns = self.format_standards.get("expression_patterns", {})
+        self._expr_replacers = {
+            pattern_type: TermReplacer(patterns)
+            for pattern_type, patterns in expression_patterns.items()
+            if pattern_type == "passive_to_active"
+        }
         
     def _load_default_standards(self) -> Dict[str, Any]:
         """加载默认格式标准"""
@@ -44,144 +148,159 @@ class KnowledgeFormatNormalizer:
             }
         }
     
+    @property
+    def changes(self) -> List[Dict]:
+        """本次规范化的变更列表（每次访问都从内部元组记录展开为字典）"""
+        return [
+            {
+                "change_type": _CHANGE_TYPE_NAMES[change_type],
+                "original": original,
+                "normalized": normalized,
+                _CHANGE_EXTRA_KEYS[change_type]: extra
+            }
+            for change_type, original, normalized, extra in self._change_records
+        ]
+    
     def normalize_content(self, content: str) -> Tuple[str, List[Dict]]:
         """规范化内容"""
-        self.changes = []
-        normalized = content
+        normalized = '\n'.join(self.normalize_lines(content.split('\n')))
+        return normalized, self.changes
+    
+    def normalize_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        逐行规范化内容（生成器）
+        
+        每行一次完成术语统一、结构优化和表达优化后立即产出，行尾换行符会被去掉；
+        可直接传入文件对象流式处理，无需先把整篇文档读入内存。
+        生成器耗尽后 self.changes 和 self.source_length 才是完整结果
+        """
+        self._change_records = []
+        self.source_length = 0
+        term_hits = set()
+        expr_hits = {pattern_type: set() for pattern_type in self._expr_replacers}
+        structure_changes = []
+        line_number = 0
+        ends_with_newline = False
+        
+        for line in lines:
+            self.source_length += len(line)
+            ends_with_newline = line.endswith('\n')
+            if ends_with_newline:
+                line = line[:-1]
+            line_number += 1
+            yield self._normalize_line(line, line_number, term_hits, expr_hits, structure_changes)
         
+        # 与 str.split('\n') 保持一致：以换行结尾时最后还有一个空行
+        if ends_with_newline:
+            line_number += 1
+            yield self._normalize_line('', line_number, term_hits, expr_hits, structure_changes)
+        
+        # 变更按类型归组：术语、结构、表达
+        self._record_terminology_changes(term_hits)
+        self._change_records.extend(structure_changes)
+        self._record_expression_changes(expr_hits)
+    
+    def _normalize_line(self, line: str, line_number: int, term_hits: Set[str],
+                        expr_hits: Dict[str, Set[str]], structure_changes: List[Tuple]) -> str:
+        """对单行依次执行术语统一、结构优化和表达优化"""
         # 1. 术语统一
-        normalized = self._normalize_terminology(normalized)
+        line = self._term_replacer.replace(line, term_hits)
         
         # 2. 结构优化
-        normalized = self._optimize_structure(normalized)
+        optimized = self._optimize_line(line)
+        if optimized != line:
+            structure_changes.append((_CT_STRUCTURE, line, optimized, line_number))
+            line = optimized
         
         # 3. 表达优化
-        normalized = self._optimize_expressions(normalized)
+        for pattern_type, replacer in self._expr_replacers.items():
+            line = replacer.replace(line, expr_hits[pattern_type])
         
-        return normalized, self.changes
+        return line
     
-    def _normalize_terminology(self, content: str) -> str:
-        """统一术语"""
-        terminology = self.format_standards.get("terminology", {})
-        
-        for old_term, new_term in terminology.items():
-            if old_term in content:
-                content = content.replace(old_term, new_term)
-                self.changes.append({
-                    "change_type": "terminology",
-                    "original": old_term,
-                    "normalized": new_term,
-                    "location": "content"
-                })
-        
-        return content
+    def _record_terminology_changes(self, hits: Set[str]) -> None:
+        """每个被替换的术语记录一次变更（按术语表顺序）"""
+        for old_term, new_term in self._term_replacer.mapping.items():
+            if old_term in hits:
+                self._change_records.append((_CT_TERMINOLOGY, old_term, new_term, "content"))
     
-    def _optimize_structure(self, content: str) -> str:
-        """优化文档结构"""
-        lines = content.split('\n')
-        optimized_lines = []
-        
-        for i, line in enumerate(lines):
-            original_line = line
-            
-            # 优化标题格式
-            if line.strip().startswith('#'):
-                line = self._optimize_title(line)
-            
-            # 优化列表格式
-            if re.match(r'^\s*[-*+]\s+', line):
-                line = self._optimize_list_item(line)
-            
-            # 优化编号列表
-            if re.match(r'^\s*\d+\.\s+', line):
-                line = self._optimize_numbered_list(line)
-            
-            if line != original_line:
-                self.changes.append({
-                    "change_type": "structure",
-                    "original": original_line,
-                    "normalized": line,
-                    "line_number": i + 1
-                })
-            
-            optimized_lines.append(line)
-        
-        return '\n'.join(optimized_lines)
+    def _record_expression_changes(self, hits_by_type: Dict[str, Set[str]]) -> None:
+        """每个被替换的表达记录一次变更（按表达模式表顺序）"""
+        for pattern_type, replacer in self._expr_replacers.items():
+            hits = hits_by_type[pattern_type]
+            for passive, active in replacer.mapping.items():
+                if passive in hits:
+                    self._change_records.append((_CT_EXPRESSION, passive, active, pattern_type))
+    
+    def _optimize_line(self, line: str) -> str:
+        """优化单行的结构格式（标题、列表、编号列表）"""
+        if line.strip().startswith('#'):
+            return self._optimize_title(line)
+        if _find_list_marker(line) >= 0:
+            return self._optimize_list_item(line)
+        if _RE_NUM.match(line):
+            return self._optimize_numbered_list(line)
+        return line
     
     def _optimize_title(self, title: str) -> str:
         """优化标题格式"""
         # 确保标题层级正确
         title = title.strip()
         
-        # 移除多余的空格
-        title = re.sub(r'^(#+)\s+', r'\1 ', title)
+        # 移除多余的空格：'#' 之后的连续空白压缩为一个空格
+        level = len(title) - len(title.lstrip('#'))
+        if level and title[level:level + 1].isspace():
+            title = title[:level] + ' ' + title[level:].lstrip()
         
         # 确保标题末尾没有标点符号
-        title = re.sub(r'([。！？,;:!?])$', '', title)
+        if title and title[-1] in _TITLE_PUNCT:
+            title = title[:-1]
         
         return title
     
     def _optimize_list_item(self, item: str) -> str:
         """优化列表项格式"""
+        marker = _find_list_marker(item)
+        if marker < 0:
+            return item
+        content_start = len(item) - len(item[marker + 1:].lstrip())
+        
         # 统一使用 '-' 作为列表符号
-        item = re.sub(r'^\s*[*+]\s+', '- ', item)
+        if item[marker] != '-':
+            item = '- ' + item[content_start:]
+            return _capitalize_at(item, 2)
         
         # 确保列表项首字母大写
-        match = re.match(r'^(\s*-\s+)(.+)$', item)
-        if match:
-            prefix = match.group(1)
-            content = match.group(2)
-            if content and content[0].islower():
-                content = content[0].upper() + content[1:]
-            item = prefix + content
-        
-        return item
+        return _capitalize_at(item, content_start)
     
     def _optimize_numbered_list(self, item: str) -> str:
         """优化编号列表格式"""
+        match = _RE_NUM_SPACE.match(item)
+        if not match:
+            return item
+        
         # 确保编号后有一个空格
-        item = re.sub(r'^(\s*\d+)\.\s+', r'\1. ', item)
+        prefix = match.group(1) + '. '
+        if match.end() != len(prefix) or not item.startswith(prefix):
+            item = prefix + item[match.end():]
         
         # 确保首字母大写
-        match = re.match(r'^(\s*\d+\.\s+)(.+)$', item)
-        if match:
-            prefix = match.group(1)
-            content = match.group(2)
-            if content and content[0].islower():
-                content = content[0].upper() + content[1:]
-            item = prefix + content
-        
-        return item
+        return _capitalize_at(item, len(prefix))
     
-    def _optimize_expressions(self, content: str) -> str:
-        """优化表达方式"""
-        expression_patterns = self.format_standards.get("expression_patterns", {})
-        
-        for pattern_type, patterns in expression_patterns.items():
-            if pattern_type == "passive_to_active":
-                for passive, active in patterns.items():
-                    if passive in content:
-                        content = content.replace(passive, active)
-                        self.changes.append({
-                            "change_type": "expression",
-                            "original": passive,
-                            "normalized": active,
-                            "pattern_type": pattern_type
-                        })
+    def generate_report(self, original: Optional[str], normalized: Optional[str], changes: List[Dict],
+                        content_length: Optional[int] = None) -> Dict[str, Any]:
+        """
+        生成规范化报告
         
-        return content
-    
-    def generate_report(self, original: str, normalized: str, changes: List[Dict]) -> Dict[str, Any]:
-        """生成规范化报告"""
+        流式处理时原文不在内存中，可传入 original=None 并通过 content_length 给出原文长度
+        """
         # 统计变更类型
-        change_stats = {}
-        for change in changes:
-            change_type = change["change_type"]
-            change_stats[change_type] = change_stats.get(change_type, 0) + 1
+        change_stats = dict(Counter(change["change_type"] for change in changes))
         
         # 计算一致性评分
         total_changes = len(changes)
-        content_length = len(original)
+        if content_length is None:
+            content_length = len(original)
         consistency_score = max(0, 1 - (total_changes / max(content_length / 100, 1)))
         
         # 计算术语统一性
@@ -251,20 +370,23 @@ def main():
         print(f"错误: 文件不存在: {content_file}")
         sys.exit(1)
     
-    # 读取内容
+    # 创建规范化器，边读取边规范化并写出，不把整篇内容读入内存
+    normalizer = KnowledgeFormatNormalizer()
+    output_file = "normalized_content.md"
     try:
-        with open(content_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(content_file, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as fin, \
+                open(output_file, 'w', encoding='utf-8') as fout:
+            for i, line in enumerate(normalizer.normalize_lines(fin)):
+                if i:
+                    fout.write('\n')
+                fout.write(line)
     except Exception as e:
-        print(f"读取文件失败: {e}")
+        print(f"处理文件失败: {e}")
         sys.exit(1)
-    
-    # 创建规范化器并执行规范化
-    normalizer = KnowledgeFormatNormalizer()
-    normalized_content, changes = normalizer.normalize_content(content)
+    changes = normalizer.changes
     
     # 生成报告
-    report = normalizer.generate_report(content, normalized_content, changes)
+    report = normalizer.generate_report(None, None, changes, content_length=normalizer.source_length)
     
     # 打印报告
     print("\n" + "="*60)
@@ -295,11 +417,6 @@ def main():
         print(f"{i}. [{rec['priority']}] {rec['recommendation']}")
         print(f"   预计工作量: {rec['estimated_effort']}")
     
-    # 保存规范化后的内容
-    output_file = "normalized_content.md"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(normalized_content)
-    
     print(f"\n📄 规范化后的内容已保存到: {output_file}")
     
     # 保存详细报告
@@ -8,8 +8,10 @@ import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-# 添加路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# 添加路径（已在 sys.path 中时不再重复插入，如经 main.py 导入）
+_SKILL_MANAGER_DIR = str(Path(__file__).parent.parent)
+if _SKILL_MANAGER_DIR not in sys.path:
+    sys.path.insert(0, _SKILL_MANAGER_DIR)
 
 from models import SkillSpec, CreationResult
 from core.structure_generator import StructureGenerator
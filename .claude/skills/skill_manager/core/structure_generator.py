@@ -6,11 +6,141 @@
 
 import os
 import shutil
+import functools
+import itertools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from models import StructureConfig, SkillSpec, TemplateConfig
 
 
+@functools.lru_cache(maxsize=256)
+def _display_name(name: str) -> str:
+    """将下划线命名转换为标题形式（如 data_cleaner -> Data Cleaner）"""
+    return name.replace('_', ' ').title()
+
+
+# 创建/截断文件的打开方式，权限同内置 open()（0o666 再受 umask 约束）
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_utf8(path: Path, text: str, mode: int = 0o666) -> None:
+    """以UTF-8写入文件：直接 os.open/os.write，不经过文本IO层；新建文件的权限在创建时由 mode 指定"""
+    fd = os.open(path, _WRITE_FLAGS, mode)
+    try:
+        data = memoryview(text.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _touch_empty(path: Path) -> None:
+    """创建（或清空）空文件，如 .gitkeep：只需打开再关闭，无需写入"""
+    os.close(os.open(path, _WRITE_FLAGS, 0o666))
+
+
+# 工具文件模板（模块级常量，按文件名查表，每次生成无需重新构造）
+_UTIL_FILE_HELPERS_TEMPLATE = '''"""文件操作工具函数"""
+
+import os
+import shutil
+import stat
+import fnmatch
+from typing import List
+
+
+def ensure_dir_exists(path: str) -> bool:
+    """确保目录存在"""
+    os.makedirs(path, exist_ok=True)
+    return True
+
+
+def safe_delete(path: str) -> bool:
+    """安全删除文件或目录"""
+    try:
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return True
+        if stat.S_ISDIR(mode):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+        return True
+    except Exception:
+        return False
+
+
+def find_files_by_pattern(root: str, pattern: str) -> List[str]:
+    """递归查找文件名匹配模式的文件（os.scandir 遍历，每个目录只扫描一次；匹配区分大小写，各平台一致）"""
+    matches = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif fnmatch.fnmatchcase(entry.name, pattern):
+                        matches.append(entry.path)
+        except OSError:
+            continue
+    return matches
+'''
+
+_UTIL_VALIDATION_RULES_TEMPLATE = '''"""验证规则工具函数"""
+
+import re
+from typing import Any
+
+# 预编译的校验正则
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$')
+_SKILL_NAME_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+
+# 长度上限：邮箱地址最长254个字符（RFC 5321），Skill名称最长64个字符
+_EMAIL_MAX_LENGTH = 254
+_SKILL_NAME_MAX_LENGTH = 64
+
+
+def validate_email(email: str) -> bool:
+    """验证邮箱格式"""
+    if not email or len(email) > _EMAIL_MAX_LENGTH:
+        return False
+    return _EMAIL_RE.match(email) is not None
+
+
+def validate_skill_name(name: str) -> bool:
+    """验证Skill名称格式"""
+    if not name or len(name) > _SKILL_NAME_MAX_LENGTH or not ('a' <= name[0] <= 'z'):
+        return False
+    return _SKILL_NAME_RE.match(name) is not None
+'''
+
+_UTIL_DEFAULT_TEMPLATE = '''"""通用工具函数"""
+
+import logging
+from datetime import datetime
+
+
+def setup_logging(level=logging.INFO):
+    """设置日志配置"""
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+def get_timestamp() -> str:
+    """获取时间戳"""
+    return datetime.now().strftime('%Y%m%d_%H%M%S')
+'''
+
+_UTIL_TEMPLATES = {
+    "file_helpers.py": _UTIL_FILE_HELPERS_TEMPLATE,
+    "validation_rules.py": _UTIL_VALIDATION_RULES_TEMPLATE,
+}
+
+
 class StructureGenerator:
     """结构生成器类"""
     
@@ -22,9 +152,10 @@ class StructureGenerator:
     def generate_structure(self, spec: SkillSpec, template: TemplateConfig) -> StructureConfig:
         """基于规格和模板生成结构配置"""
         directories = []
-        scripts = template.scripts
+        # 模板在多次选择间共享，结构配置使用各自的列表副本
+        scripts = list(template.scripts)
         templates = []
-        examples = template.examples
+        examples = list(template.examples)
         
         # 添加脚本目录
         if spec.include_scripts and scripts:
@@ -58,62 +189,97 @@ class StructureGenerator:
         """创建完整的Skill结构"""
         skill_dir = self.base_path / config.name
         
+        # 处理已存在的目录
+        if skill_dir.exists():
+            return False
+        
+        # 先在同级的临时目录中生成，完成后一次 rename 发布，
+        # 失败时目标目录从未出现，不会留下半成品
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        staging_dir = self._make_staging_dir(config.name)
+        
         try:
-            # 处理已存在的目录
-            if skill_dir.exists():
-                return False
-            
-            # 创建主目录
-            skill_dir.mkdir(parents=True, exist_ok=True)
-            
             # 创建必需文件
-            self._create_required_files(skill_dir, config)
+            self._create_required_files(staging_dir, config)
             
             # 创建目录结构
-            self._create_directories(skill_dir, config.directories)
+            self._create_directories(staging_dir, config)
             
             # 创建脚本文件
             if config.scripts:
-                self._create_script_files(skill_dir, config.scripts, config.skill_type)
+                self._create_script_files(staging_dir, config.scripts, config.skill_type)
             
             # 创建模板文件
             if config.templates:
-                self._create_template_files(skill_dir, config.templates, config.skill_type)
+                self._create_template_files(staging_dir, config.templates, config.skill_type)
             
             # 创建示例文件
             if config.examples:
-                self._create_example_files(skill_dir, config.examples, config.skill_type)
+                self._create_example_files(staging_dir, config.examples, config.skill_type)
             
             # 创建工具文件
             if 'utils' in config.directories:
-                self._create_utils_files(skill_dir)
+                self._create_utils_files(staging_dir)
             
+            # 发布到最终位置（同一文件系统内原子完成）
+            try:
+                os.rename(staging_dir, skill_dir)
+            except OSError:
+                # 生成期间同名Skill已被并发创建，按已存在处理
+                if not skill_dir.exists():
+                    raise
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                return False
             return True
             
         except Exception as e:
-            # 清理已创建的目录
-            if skill_dir.exists():
-                shutil.rmtree(skill_dir)
+            # 清理临时目录
+            shutil.rmtree(staging_dir, ignore_errors=True)
             raise e
     
+    def _make_staging_dir(self, name: str) -> Path:
+        """创建本次生成专用的临时目录；同名目录已存在（如进程号复用时的遗留目录）则换下一个序号"""
+        prefix = f".{name}.partial.{os.getpid()}"
+        for attempt in itertools.count():
+            staging_dir = self.base_path / f"{prefix}.{attempt}"
+            try:
+                staging_dir.mkdir()
+            except FileExistsError:
+                continue
+            return staging_dir
+    
     def _create_required_files(self, skill_dir: Path, config: StructureConfig):
         """创建必需文件"""
         # SKILL.md
         skill_content = self._generate_skill_md(config)
-        (skill_dir / "SKILL.md").write_text(skill_content, encoding='utf-8')
+        _write_utf8(skill_dir / "SKILL.md", skill_content)
         
         # README.md
         readme_content = self._generate_readme_md(config)
-        (skill_dir / "README.md").write_text(readme_content, encoding='utf-8')
+        _write_utf8(skill_dir / "README.md", readme_content)
     
-    def _create_directories(self, skill_dir: Path, directories: list):
-        """创建目录结构"""
-        for dir_name in directories:
-            dir_path = skill_dir / dir_name
-            dir_path.mkdir(exist_ok=True)
-            
-            # 添加.gitkeep
-            (dir_path / ".gitkeep").write_text("", encoding='utf-8')
+    def _create_directories(self, skill_dir: Path, config: StructureConfig):
+        """创建目录结构（包括模板和示例子目录），父目录在前、每个目录只 mkdir 一次"""
+        dir_paths = [skill_dir / dir_name for dir_name in config.directories]
+        for parent_name, names in (("templates", config.templates), ("examples", config.examples)):
+            if names:
+                parent = skill_dir / parent_name
+                dir_paths.append(parent)
+                dir_paths.extend(parent / name for name in names)
+        
+        created = set()
+        for dir_path in sorted(dir_paths, key=lambda path: len(path.parts)):
+            if dir_path in created:
+                continue
+            created.add(dir_path)
+            try:
+                os.mkdir(dir_path)
+            except FileExistsError:
+                pass
+        
+        # 添加.gitkeep
+        for dir_name in config.directories:
+            _touch_empty(skill_dir / dir_name / ".gitkeep")
     
     def _create_script_files(self, skill_dir: Path, scripts: list, skill_type: str):
         """创建脚本文件"""
@@ -122,8 +288,8 @@ class StructureGenerator:
         for script_name in scripts:
             script_path = scripts_dir / script_name
             script_content = self._generate_script_template(script_name, skill_type)
-            script_path.write_text(script_content, encoding='utf-8')
-            script_path.chmod(0o755)
+            # 创建时即带可执行权限，无需再单独 chmod
+            _write_utf8(script_path, script_content, 0o755)
     
     def _create_template_files(self, skill_dir: Path, templates: list, skill_type: str):
         """创建模板文件"""
@@ -131,10 +297,8 @@ class StructureGenerator:
         
         for template_name in templates:
             template_dir = templates_dir / template_name
-            template_dir.mkdir(parents=True, exist_ok=True)
-            
             template_content = self._generate_template_skill_md(template_name, skill_type)
-            (template_dir / "SKILL.md").write_text(template_content, encoding='utf-8')
+            _write_utf8(template_dir / "SKILL.md", template_content)
     
     def _create_example_files(self, skill_dir: Path, examples: list, skill_type: str):
         """创建示例文件"""
@@ -142,34 +306,33 @@ class StructureGenerator:
         
         for example_name in examples:
             example_dir = examples_dir / example_name
-            example_dir.mkdir(parents=True, exist_ok=True)
-            
             example_content = self._generate_example_readme(example_name, skill_type)
-            (example_dir / "README.md").write_text(example_content, encoding='utf-8')
-            (example_dir / ".gitkeep").write_text("", encoding='utf-8')
+            _write_utf8(example_dir / "README.md", example_content)
+            _touch_empty(example_dir / ".gitkeep")
     
     def _create_utils_files(self, skill_dir: Path):
         """创建工具文件"""
         utils_dir = skill_dir / "utils"
         
         # __init__.py
-        (utils_dir / "__init__.py").write_text("# Utility functions\n", encoding='utf-8')
+        _write_utf8(utils_dir / "__init__.py", "# Utility functions\n")
         
         # 常用工具文件
         common_utils = ["file_helpers.py", "validation_rules.py", "logging_utils.py"]
         
         for util_file in common_utils:
             util_content = self._generate_util_template(util_file)
-            (utils_dir / util_file).write_text(util_content, encoding='utf-8')
+            _write_utf8(utils_dir / util_file, util_content)
     
     def _generate_skill_md(self, config: StructureConfig) -> str:
         """生成SKILL.md内容"""
+        display_name = _display_name(config.name)
         return f"""---
 name: {config.name}
 description: {config.description}
 ---
 
-# {config.name.replace('_', ' ').title()}
+# {display_name}
 
 ## 🎯 概述
 
@@ -222,12 +385,12 @@ description: {config.description}
 
 ---
 
-**{config.name.replace('_', ' ').title()}** - 让工作更高效！ 🚀
+**{display_name}** - 让工作更高效！ 🚀
 """
     
     def _generate_readme_md(self, config: StructureConfig) -> str:
         """生成README.md内容"""
-        return f"""# {config.name.replace('_', ' ').title()}
+        return f"""# {_display_name(config.name)}
 
 ## 📖 使用说明
 
@@ -276,8 +439,10 @@ A: [解决方案]
 [许可证信息]
 """
     
-    def _generate_script_template(self, script_name: str, skill_type: str) -> str:
-        """生成脚本模板"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_script_template(script_name: str, skill_type: str) -> str:
+        """生成脚本模板（只依赖参数，渲染结果按参数缓存，批量生成时相同的名称直接复用）"""
         return f"""#!/usr/bin/env python3
 \"\"\"
 {script_name} - [功能描述]
@@ -306,14 +471,16 @@ if __name__ == "__main__":
     main()
 """
     
-    def _generate_template_skill_md(self, template_name: str, skill_type: str) -> str:
-        """生成模板SKILL.md"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_template_skill_md(template_name: str, skill_type: str) -> str:
+        """生成模板SKILL.md（只依赖参数，渲染结果按参数缓存，批量生成时相同的名称直接复用）"""
         return f"""---
 name: {template_name}
 description: {skill_type}类型Skill模板
 ---
 
-# {template_name.replace('_', ' ').title()} 模板
+# {_display_name(template_name)} 模板
 
 这是{skill_type}类型Skill的标准化模板。
 
@@ -330,9 +497,11 @@ description: {skill_type}类型Skill模板
 - 可扩展设计
 """
     
-    def _generate_example_readme(self, example_name: str, skill_type: str) -> str:
-        """生成示例README"""
-        return f"""# {example_name.replace('_', ' ').title()} 示例
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_example_readme(example_name: str, skill_type: str) -> str:
+        """生成示例README（只依赖参数，渲染结果按参数缓存，批量生成时相同的名称直接复用）"""
+        return f"""# {_display_name(example_name)} 示例
 
 ## 示例描述
 
@@ -351,66 +520,4 @@ description: {skill_type}类型Skill模板
     
     def _generate_util_template(self, util_file: str) -> str:
         """生成工具模板"""
-        if util_file == "file_helpers.py":
-            return '''"""文件操作工具函数"""
-
-import os
-import shutil
-from pathlib import Path
-from typing import List
-
-
-def ensure_dir_exists(path: str) -> bool:
-    """确保目录存在"""
-    Path(path).mkdir(parents=True, exist_ok=True)
-    return True
-
-
-def safe_delete(path: str) -> bool:
-    """安全删除文件或目录"""
-    try:
-        if os.path.isfile(path):
-            os.remove(path)
-        elif os.path.isdir(path):
-            shutil.rmtree(path)
-        return True
-    except Exception:
-        return False
-'''
-        elif util_file == "validation_rules.py":
-            return '''"""验证规则工具函数"""
-
-import re
-from typing import Any
-
-
-def validate_email(email: str) -> bool:
-    """验证邮箱格式"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
-
-
-def validate_skill_name(name: str) -> bool:
-    """验证Skill名称格式"""
-    pattern = r'^[a-z][a-z0-9_]*(_[a-z0-9]+)*$'
-    return bool(re.match(pattern, name))
-'''
-        else:
-            return '''"""通用工具函数"""
-
-import logging
-from datetime import datetime
-
-
-def setup_logging(level=logging.INFO):
-    """设置日志配置"""
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
-
-def get_timestamp() -> str:
-    """获取时间戳"""
-    return datetime.now().strftime('%Y%m%d_%H%M%S')
-'''
\ No newline at end of file
+        return _UTIL_TEMPLATES.get(util_file, _UTIL_DEFAULT_TEMPLATE)
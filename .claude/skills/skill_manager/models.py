@@ -3,10 +3,15 @@
 数据模型定义
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from datetime import datetime
 
+# dataclass 的 slots 参数需要 Python 3.10+，低版本退回普通实例字典
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class OperationRecord:
@@ -60,9 +65,9 @@ class OperationRecord:
         return self.exit_code == 0 and self.result_code == 0
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SkillSpec:
-    """Skill规格定义"""
+    """Skill规格定义（不可变）"""
     name: str
     description: str
     skill_type: str  # data_processor, api_integrator, file_operator, content_creator, document_generator, workflow
@@ -90,14 +95,14 @@ class SkillSpec:
         return True
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TemplateConfig:
-    """模板配置"""
+    """模板配置（不可变：预定义模板在多次选择间共享，序列字段用元组、选项用只读映射）"""
     skill_type: str
     description: str
-    required_tools: List[str]
-    scripts: List[str]
-    examples: List[str]
+    required_tools: Tuple[str, ...]
+    scripts: Tuple[str, ...]
+    examples: Tuple[str, ...]
     documentation_level: str = 'basic'
     include_validation: bool = False
     error_handling: str = 'basic'
@@ -113,12 +118,12 @@ class TemplateConfig:
     publishing: bool = False
     templates: bool = False
     versioning: bool = False
-    custom_options: Dict[str, Any] = field(default_factory=dict)
+    custom_options: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class StructureConfig:
-    """结构配置"""
+    """结构配置（不可变）"""
     name: str
     description: str
     skill_type: str
@@ -5,6 +5,7 @@ Skill管理器
 """
 
 import sys
+import json
 import argparse
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -48,7 +49,9 @@ class SkillManager:
         self.logger.info("列出所有Skills...")
         
         skills = []
-        skill_dirs = [d for d in self.skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()]
+        # 跳过隐藏目录（包括创建中断时遗留的 .<name>.partial.* 临时目录）
+        skill_dirs = [d for d in self.skills_dir.iterdir()
+                      if not d.name.startswith('.') and d.is_dir() and (d / "SKILL.md").exists()]
         
         for skill_dir in skill_dirs:
             skill_name = skill_dir.name
@@ -509,23 +512,27 @@ def main():
         # 列出Skills
         skills = manager.list_skills(detailed=args.detailed)
         
+        # 先拼好全部输出行，最后一次写出，避免每行一次 print
+        lines = []
         if args.detailed:
             for skill in skills:
-                print(f"{'='*60}")
-                print(f"名称: {skill['name']}")
-                print(f"描述: {skill['description']}")
-                print(f"工具: {', '.join(skill['tools'])}")
-                print(f"路径: {skill['path']}")
-                print(f"scripts: {'✅' if skill['has_scripts'] else '❌'}")
-                print(f"examples: {'✅' if skill['has_examples'] else '❌'}")
-                print(f"大小: {manager._format_size(skill['file_size'])}")
+                lines.append(f"{'='*60}")
+                lines.append(f"名称: {skill['name']}")
+                lines.append(f"描述: {skill['description']}")
+                lines.append(f"工具: {', '.join(skill['tools'])}")
+                lines.append(f"路径: {skill['path']}")
+                lines.append(f"scripts: {'✅' if skill['has_scripts'] else '❌'}")
+                lines.append(f"examples: {'✅' if skill['has_examples'] else '❌'}")
+                lines.append(f"大小: {manager._format_size(skill['file_size'])}")
         else:
-            print(f"{'名称':<30} {'描述':<40} {'scripts':<8} {'examples'}")
-            print("-" * 80)
+            lines.append(f"{'名称':<30} {'描述':<40} {'scripts':<8} {'examples'}")
+            lines.append("-" * 80)
             for skill in skills:
-                print(f"{skill['name']:<30} {skill['description']:<40} "
-                      f"{'✅' if skill['has_scripts'] else '❌':<8} "
-                      f"{'✅' if skill['has_examples'] else '❌'}")
+                lines.append(f"{skill['name']:<30} {skill['description']:<40} "
+                             f"{'✅' if skill['has_scripts'] else '❌':<8} "
+                             f"{'✅' if skill['has_examples'] else '❌'}")
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
     
     elif args.command == 'create':
         # 创建Skill
@@ -544,7 +551,6 @@ def main():
             results = manager.validate_all_skills()
         
         if args.json:
-            import json
             json_results = {
                 name: {
                     "is_valid": result.is_valid,
@@ -4,7 +4,9 @@ Skill验证器
 验证Skill目录结构、YAML头部、Markdown结构等
 """
 
+import os
 import sys
+import ast
 import json
 import argparse
 from pathlib import Path
@@ -38,13 +40,17 @@ class SkillValidator:
                                    level=logging.DEBUG if verbose else logging.INFO)
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # 已解析的SKILL.md：(路径, 修改时间) -> (front_matter, content)，文件未变时不再重复读取和解析YAML
+        self._markdown_cache: Dict[Tuple[str, int], Tuple[Dict[str, Any], str]] = {}
     
-    def validate_skill(self, skill_name: str) -> ValidationResult:
+    def validate_skill(self, skill_name: str,
+                       entries: Optional[Dict[str, os.DirEntry]] = None) -> ValidationResult:
         """
         验证单个Skill
         
         Args:
             skill_name: Skill名称
+            entries: 已扫描的Skill目录项（可选，批量验证时传入以免重复扫描目录）
             
         Returns:
             验证结果
@@ -59,9 +65,13 @@ class SkillValidator:
         if not self._validate_directory_exists(skill_dir, skill_name):
             return ValidationResult(False, f"Skill目录不存在: {skill_name}", self.errors)
         
+        # 一次扫描Skill目录，后续检查直接使用缓存了类型信息的目录项
+        if entries is None:
+            entries = self._scan_directory(skill_dir)
+        
         # 2. 验证SKILL.md存在
         skill_file = skill_dir / "SKILL.md"
-        if not self._validate_file_exists(skill_file, "SKILL.md"):
+        if not self._validate_file_entry(entries.get("SKILL.md"), skill_file):
             return ValidationResult(False, f"SKILL.md不存在: {skill_name}", self.errors)
         
         # 3. 验证YAML头部
@@ -73,15 +83,15 @@ class SkillValidator:
             pass  # 错误已在方法内添加
         
         # 5. 验证scripts目录（如果存在）
-        scripts_dir = skill_dir / "scripts"
-        if scripts_dir.exists():
-            if not self._validate_scripts_directory(scripts_dir):
+        scripts_entry = entries.get("scripts")
+        if scripts_entry is not None and scripts_entry.is_dir():
+            if not self._validate_scripts_directory(Path(scripts_entry.path)):
                 pass  # 错误已在方法内添加
         
         # 6. 验证examples目录（如果存在）
-        examples_dir = skill_dir / "examples"
-        if examples_dir.exists():
-            if not self._validate_examples_directory(examples_dir):
+        examples_entry = entries.get("examples")
+        if examples_entry is not None and examples_entry.is_dir():
+            if not self._validate_examples_directory(Path(examples_entry.path)):
                 pass  # 错误已在方法内添加
         
         # 返回结果
@@ -109,15 +119,21 @@ class SkillValidator:
         self.logger.debug(f"✓ 目录存在: {directory}")
         return True
     
-    def _validate_file_exists(self, file_path: Path, name: str) -> bool:
-        """验证文件存在"""
-        if not file_path.exists():
+    @staticmethod
+    def _scan_directory(directory: Path) -> Dict[str, os.DirEntry]:
+        """扫描目录一次，返回 名称 -> 目录项 的映射（目录项缓存了文件类型，无需再次stat）"""
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    
+    def _validate_file_entry(self, entry: Optional[os.DirEntry], file_path: Path) -> bool:
+        """根据目录扫描得到的目录项验证文件存在"""
+        if entry is None:
             error = f"文件不存在: {file_path}"
             self.errors.append(error)
             self.logger.error(error)
             return False
         
-        if not file_path.is_file():
+        if not entry.is_file():
             error = f"路径存在但不是文件: {file_path}"
             self.errors.append(error)
             self.logger.error(error)
@@ -126,10 +142,19 @@ class SkillValidator:
         self.logger.debug(f"✓ 文件存在: {file_path}")
         return True
     
+    def _read_markdown(self, skill_file: Path) -> Tuple[Dict[str, Any], str]:
+        """读取并解析带front matter的Markdown文件，按 (路径, 修改时间) 缓存解析结果"""
+        key = (str(skill_file), skill_file.stat().st_mtime_ns)
+        cached = self._markdown_cache.get(key)
+        if cached is None:
+            cached = FileHelper.read_markdown_with_frontmatter(skill_file)
+            self._markdown_cache[key] = cached
+        return cached
+    
     def _validate_yaml_header(self, skill_file: Path) -> bool:
         """验证YAML头部"""
         try:
-            frontmatter, _ = FileHelper.read_markdown_with_frontmatter(skill_file)
+            frontmatter, _ = self._read_markdown(skill_file)
             
             if not frontmatter:
                 error = "YAML front matter不存在或格式错误"
@@ -164,7 +189,7 @@ class SkillValidator:
     def _validate_markdown_structure(self, skill_file: Path) -> bool:
         """验证Markdown结构"""
         try:
-            _, content = FileHelper.read_markdown_with_frontmatter(skill_file)
+            _, content = self._read_markdown(skill_file)
             
             # 检查必需章节
             required_sections = [
@@ -192,7 +217,9 @@ class SkillValidator:
     def _validate_scripts_directory(self, scripts_dir: Path) -> bool:
         """验证scripts目录"""
         try:
-            python_files = list(scripts_dir.glob("*.py"))
+            with os.scandir(scripts_dir) as it:
+                python_files = [Path(entry.path) for entry in it
+                                if entry.name.endswith(".py") and entry.is_file()]
             
             if not python_files:
                 warning = f"scripts目录存在但没有Python文件: {scripts_dir}"
@@ -200,11 +227,11 @@ class SkillValidator:
                 self.logger.warning(warning)
                 return True
             
-            # 验证Python文件语法
+            # 验证Python文件语法（只解析为语法树，不生成字节码）
             for py_file in python_files:
                 try:
                     with open(py_file, 'r', encoding='utf-8') as f:
-                        compile(f.read(), str(py_file), 'exec')
+                        ast.parse(f.read(), filename=str(py_file))
                     self.logger.debug(f"✓ Python文件语法正确: {py_file.name}")
                 except SyntaxError as e:
                     error = f"Python文件语法错误 {py_file.name}: {str(e)}"
@@ -222,7 +249,9 @@ class SkillValidator:
     def _validate_examples_directory(self, examples_dir: Path) -> bool:
         """验证examples目录"""
         try:
-            if not any(examples_dir.iterdir()):
+            with os.scandir(examples_dir) as it:
+                is_empty = next(it, None) is None
+            if is_empty:
                 warning = f"examples目录为空: {examples_dir}"
                 self.warnings.append(warning)
                 self.logger.warning(warning)
@@ -246,13 +275,20 @@ class SkillValidator:
         self.logger.info(f"开始验证所有Skills，目录: {self.skills_dir}")
         
         results = {}
-        skill_dirs = [d for d in self.skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()]
+        # 每个目录只扫描一次：目录项自带类型信息，SKILL.md 是否存在直接查扫描结果
+        skill_dirs = {}
+        with os.scandir(self.skills_dir) as it:
+            for entry in it:
+                # 跳过隐藏目录（包括创建中断时遗留的 .<name>.partial.* 临时目录）
+                if entry.is_dir() and not entry.name.startswith('.'):
+                    entries = self._scan_directory(Path(entry.path))
+                    if "SKILL.md" in entries:
+                        skill_dirs[entry.name] = entries
         
         self.logger.info(f"发现 {len(skill_dirs)} 个Skills")
         
-        for skill_dir in skill_dirs:
-            skill_name = skill_dir.name
-            result = self.validate_skill(skill_name)
+        for skill_name, entries in skill_dirs.items():
+            result = self.validate_skill(skill_name, entries)
             results[skill_name] = result
             
             if result.is_valid:
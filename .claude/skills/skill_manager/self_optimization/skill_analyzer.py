@@ -7,6 +7,7 @@ Skill结构分析器
 import os
 import sys
 import re
+import json
 import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -197,16 +198,17 @@ class SkillStructureAnalyzer:
 
         results = {}
 
-        for skill_dir in self.skills_dir.iterdir():
-            if not skill_dir.is_dir():
-                continue
+        # os.scandir 的目录项自带文件类型，判断是否为目录无需逐个 stat
+        with os.scandir(self.skills_dir) as it:
+            skill_dirs = [entry for entry in it if entry.is_dir()]
 
+        for skill_dir in skill_dirs:
             # 跳过隐藏目录和特殊目录
             if skill_dir.name.startswith('.') or skill_dir.name == '__pycache__':
                 continue
 
             # 检查是否有SKILL.md文件
-            if not (skill_dir / 'SKILL.md').exists():
+            if not os.path.exists(os.path.join(skill_dir.path, 'SKILL.md')):
                 continue
 
             try:
@@ -219,13 +221,21 @@ class SkillStructureAnalyzer:
 
     def _check_file_structure(self, skill_path: Path, analysis: SkillStructureAnalysis):
         """检查文件结构"""
-        analysis.has_skill_md = (skill_path / 'SKILL.md').exists()
-        analysis.has_readme = (skill_path / 'README.md').exists()
-        analysis.has_scripts = (skill_path / 'scripts').exists() and (skill_path / 'scripts').is_dir()
-        analysis.has_examples = (skill_path / 'examples').exists() and (skill_path / 'examples').is_dir()
-        analysis.has_utils = (skill_path / 'utils').exists() and (skill_path / 'utils').is_dir()
-        analysis.has_config = (skill_path / 'config').exists() and (skill_path / 'config').is_dir()
-        analysis.has_templates = (skill_path / 'templates').exists() and (skill_path / 'templates').is_dir()
+        # 扫描一次Skill目录，之后的判断都基于目录项，不再逐个路径 stat
+        with os.scandir(skill_path) as it:
+            entries = {entry.name: entry for entry in it}
+
+        def has_dir(name: str) -> bool:
+            entry = entries.get(name)
+            return entry is not None and entry.is_dir()
+
+        analysis.has_skill_md = 'SKILL.md' in entries
+        analysis.has_readme = 'README.md' in entries
+        analysis.has_scripts = has_dir('scripts')
+        analysis.has_examples = has_dir('examples')
+        analysis.has_utils = has_dir('utils')
+        analysis.has_config = has_dir('config')
+        analysis.has_templates = has_dir('templates')
 
     def _check_documentation(self, skill_path: Path, analysis: SkillStructureAnalysis):
         """检查文档质量"""
@@ -385,7 +395,6 @@ class SkillStructureAnalyzer:
         }
 
         if output_file:
-            import json
             try:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     json.dump(report, f, ensure_ascii=False, indent=2)
@@ -406,8 +415,6 @@ def get_skill_analyzer() -> SkillStructureAnalyzer:
 
 
 if __name__ == '__main__':
-    import json
-
     # 测试分析器
     analyzer = SkillStructureAnalyzer()
 
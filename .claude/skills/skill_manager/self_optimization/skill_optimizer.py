@@ -14,6 +14,12 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# 优先使用 libyaml 的C实现加载器，未编译 libyaml 时退回纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # 添加路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -222,7 +228,7 @@ python scripts/main.py --advanced [参数]
         
         if metadata_match:
             try:
-                metadata = yaml.safe_load(metadata_match.group(1))
+                metadata = yaml.load(metadata_match.group(1), Loader=_YamlLoader)
             except:
                 metadata = {}
         else:
@@ -5,12 +5,24 @@
 """
 
 import os
+import re
+import stat
 import json
+import fnmatch
 import yaml
 from pathlib import Path
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Callable, Dict, Iterator, List, Union, Optional
 import shutil
 
+# 优先使用 libyaml 的C实现加载器，未编译 libyaml 时退回纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# front matter 的结束分隔行：整行只有 '---'（之后是换行或文件结尾）
+_FRONTMATTER_END_RE = re.compile(r'\n---(?:\r?\n|\Z)')
+
 
 class FileHelper:
     """文件操作助手类"""
@@ -119,7 +131,7 @@ class FileHelper:
         """
         try:
             content = FileHelper.read_file(file_path, encoding)
-            return yaml.safe_load(content) or {}
+            return yaml.load(content, Loader=_YamlLoader) or {}
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"YAML解析失败 {file_path}: {str(e)}")
     
@@ -163,14 +175,16 @@ class FileHelper:
         try:
             content = FileHelper.read_file(file_path, encoding)
             
-            # 检查是否有YAML front matter
+            # 检查是否有YAML front matter：首行为 '---'，之后以单独一行的 '---' 结束
             if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    frontmatter_yaml = parts[1].strip()
-                    markdown_content = parts[2].strip()
-                    frontmatter = yaml.safe_load(frontmatter_yaml) or {}
-                    return frontmatter, markdown_content
+                header_start = content.find('\n') + 1
+                if header_start and not content[3:header_start].strip():
+                    end_match = _FRONTMATTER_END_RE.search(content, header_start - 1)
+                    if end_match:
+                        frontmatter_yaml = content[header_start:end_match.start()].strip()
+                        markdown_content = content[end_match.end():].strip()
+                        frontmatter = yaml.load(frontmatter_yaml, Loader=_YamlLoader) or {}
+                        return frontmatter, markdown_content
             
             # 没有front matter
             return {}, content.strip()
@@ -210,17 +224,17 @@ class FileHelper:
     @staticmethod
     def file_exists(file_path: Union[str, Path]) -> bool:
         """检查文件是否存在"""
-        return Path(file_path).exists()
+        return os.path.exists(file_path)
     
     @staticmethod
     def is_file(file_path: Union[str, Path]) -> bool:
         """检查路径是否为文件"""
-        return Path(file_path).is_file()
+        return os.path.isfile(file_path)
     
     @staticmethod
     def is_directory(path: Union[str, Path]) -> bool:
         """检查路径是否为目录"""
-        return Path(path).is_dir()
+        return os.path.isdir(path)
     
     @staticmethod
     def get_file_size(file_path: Union[str, Path]) -> int:
@@ -236,7 +250,7 @@ class FileHelper:
         Raises:
             FileNotFoundError: 文件不存在
         """
-        return Path(file_path).stat().st_size
+        return os.stat(file_path).st_size
     
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -274,17 +288,18 @@ class FileHelper:
             文件信息字典
         """
         path = Path(file_path)
-        stat = path.stat()
+        file_stat = os.stat(file_path)
         
+        # 文件类型直接取自同一次 stat 的结果，不再额外 stat
         return {
             "name": path.name,
             "path": str(path.absolute()),
-            "size": stat.st_size,
-            "size_formatted": FileHelper.format_file_size(stat.st_size),
-            "created": stat.st_ctime,
-            "modified": stat.st_mtime,
-            "is_file": path.is_file(),
-            "is_dir": path.is_dir(),
+            "size": file_stat.st_size,
+            "size_formatted": FileHelper.format_file_size(file_stat.st_size),
+            "created": file_stat.st_ctime,
+            "modified": file_stat.st_mtime,
+            "is_file": stat.S_ISREG(file_stat.st_mode),
+            "is_dir": stat.S_ISDIR(file_stat.st_mode),
             "extension": path.suffix,
             "parent": str(path.parent)
         }
@@ -338,11 +353,15 @@ class FileHelper:
             IOError: 删除失败
         """
         try:
-            path = Path(file_path)
-            if path.is_file():
-                path.unlink()
-            elif path.is_dir():
-                shutil.rmtree(path)
+            # 一次 lstat 判断类型：真实目录递归删除，文件和符号链接直接删除
+            try:
+                mode = os.lstat(file_path).st_mode
+            except FileNotFoundError:
+                return
+            if stat.S_ISDIR(mode):
+                shutil.rmtree(file_path)
+            else:
+                os.unlink(file_path)
         except Exception as e:
             raise IOError(f"删除文件失败 {file_path}: {str(e)}")
     
@@ -363,10 +382,42 @@ class FileHelper:
         """
         path = Path(directory)
         
-        if recursive:
-            return list(path.rglob(pattern))
-        else:
+        if not recursive:
             return list(path.glob(pattern))
+        
+        # 含路径分隔符等复杂模式仍交给 rglob
+        if not pattern or pattern == '**' or '/' in pattern or os.sep in pattern:
+            return list(path.rglob(pattern))
+        
+        if not path.is_dir():
+            return []
+        
+        # 仅按文件名匹配时，每个目录只 scandir 一次（rglob 对每个目录要扫描两遍）
+        flags = re.IGNORECASE if os.path.normcase('A') != 'A' else 0
+        match = re.compile(fnmatch.translate(pattern), flags).match
+        return [Path(p) for p in FileHelper._scan_matches(os.fspath(path), match)]
+    
+    @staticmethod
+    def _scan_matches(directory: str, match: Callable[[str], Any]) -> Iterator[str]:
+        """递归扫描目录，按与 rglob 相同的顺序产出名称匹配的路径（不跟随目录符号链接）"""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            return
+        
+        subdirs = []
+        for entry in entries:
+            if match(entry.name):
+                yield entry.path
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError:
+                pass
+        
+        for subdir in subdirs:
+            yield from FileHelper._scan_matches(subdir, match)
     
     @staticmethod
     def ensure_directory(directory: Union[str, Path]) -> Path:
@@ -379,9 +430,8 @@ class FileHelper:
         Returns:
             目录路径对象
         """
-        path = Path(directory)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        os.makedirs(directory, exist_ok=True)
+        return Path(directory)
 
 
 if __name__ == "__main__":